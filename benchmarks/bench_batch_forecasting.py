@@ -0,0 +1,59 @@
+"""
+Benchmark: Batch Forecasting Throughput
+========================================
+Author: Vinisha Biju
+Project: Netflix Business Analytics
+Description: Measures series/sec of the batch title-addition forecaster for different pool sizes
+
+Usage:
+    python benchmarks/bench_batch_forecasting.py --titles 500000 --values 1000 --workers 1 4 8
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from batch_forecasting import NetflixBatchForecaster
+
+
+def synthetic_catalog(n_titles, n_values, seed=42):
+    """
+    Catalog with ``n_values`` distinct values per dimension, i.e. about 3 * n_values series
+    """
+    rng = np.random.default_rng(seed)
+    # Zipf-like popularity so some series are dense and some sparse (and fail)
+    weights = 1 / np.arange(1, n_values + 1)
+    weights /= weights.sum()
+    return pd.DataFrame({
+        'primary_country': rng.choice([f'Country {i}' for i in range(n_values)], size=n_titles, p=weights),
+        'primary_genre': rng.choice([f'Genre {i}' for i in range(n_values)], size=n_titles, p=weights),
+        'rating': rng.choice([f'Rating {i}' for i in range(n_values)], size=n_titles, p=weights),
+        'year_added': rng.integers(2012, 2022, size=n_titles),
+        'month_added': rng.integers(1, 13, size=n_titles)
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--titles', type=int, default=200000)
+    parser.add_argument('--values', type=int, default=400)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count() or 1])
+    parser.add_argument('--chunksize', type=int, default=None)
+    args = parser.parse_args()
+
+    catalog = synthetic_catalog(args.titles, args.values)
+    rows = []
+    for n_workers in sorted(set(args.workers)):
+        batch = NetflixBatchForecaster().build_series(catalog)
+        batch.forecast_all(n_workers=n_workers, chunksize=args.chunksize)
+        rows.append({key: batch.stats[key] for key in
+                     ['n_series', 'n_failed', 'n_workers', 'chunksize', 'build_time_sec', 'wall_time_sec', 'series_per_sec']})
+
+    print("\n" + "="*80)
+    print("BATCH FORECASTING THROUGHPUT")
+    print("="*80)
+    print(pd.DataFrame(rows).to_string(index=False, float_format=lambda v: f'{v:.2f}'))
@@ -0,0 +1,77 @@
+"""
+Benchmark: CLI Startup Import Time
+===================================
+Author: Vinisha Biju
+Project: Netflix Business Analytics
+Description: Measures per-subcommand import cost with ``python -X importtime`` and lists heavy libraries loaded
+
+Each subcommand's pipeline module is imported in a fresh interpreter, the way
+``netflix_cli`` loads it, and compared with eagerly importing every heavy
+library the pipelines use.
+
+Usage:
+    python benchmarks/bench_cli_import_time.py --repeats 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+sys.path.insert(0, SRC_DIR)
+from netflix_cli import COMMAND_MODULES
+
+HEAVY_PACKAGES = ['matplotlib', 'seaborn', 'sklearn', 'scipy', 'statsmodels']
+EAGER_IMPORTS = ('import matplotlib.pyplot, seaborn, scipy.stats, sklearn.ensemble, sklearn.metrics, '
+                 'statsmodels.tsa.arima.model')
+
+
+def import_profile(code):
+    """
+    Run ``code`` under ``-X importtime`` and return (total import ms, heavy packages loaded)
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True, cwd=SRC_DIR)
+    total_us = 0
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        packages.add(name.strip().split('.')[0])
+    return total_us / 1000, [package for package in HEAVY_PACKAGES if package in packages]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    targets = {command: f"import netflix_cli; netflix_cli.load_command_module('{command}')"
+               for command in COMMAND_MODULES}
+    targets['(eager heavy imports)'] = f"import pandas, numpy; {EAGER_IMPORTS}"
+
+    rows = []
+    for name, code in targets.items():
+        # First run warms the filesystem and bytecode caches
+        import_profile(code)
+        timings = []
+        for _ in range(args.repeats):
+            total_ms, heavy = import_profile(code)
+            timings.append(total_ms)
+        rows.append({
+            'subcommand': name,
+            'import_ms_median': np.median(timings),
+            'import_ms_min': np.min(timings),
+            'heavy_libraries_loaded': ', '.join(heavy) or '-'
+        })
+
+    print("\n" + "="*80)
+    print("CLI IMPORT TIME PER SUBCOMMAND (python -X importtime)")
+    print("="*80)
+    print(pd.DataFrame(rows).to_string(index=False, float_format=lambda v: f'{v:.1f}'))
@@ -0,0 +1,94 @@
+"""
+Benchmark: Incremental vs Full Churn Model Retraining
+======================================================
+Author: Vinisha Biju
+Project: Netflix Business Analytics
+Description: Compares warm-start retraining with a full retrain on the same appended rows
+
+Usage:
+    python benchmarks/bench_incremental_retraining.py --data data/netflix_processed.csv --new-fraction 0.05
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+modeling = importlib.import_module('03_predictive_modeling')
+
+
+def churn_labels(n_rows):
+    # Same synthetic labelling as NetflixPredictiveModels.prepare_churn_data
+    np.random.seed(42)
+    return np.random.binomial(1, 0.15, size=n_rows)
+
+
+def holdout_accuracy(model, holdout):
+    features = model.get_feature_set().columns
+    X = model.scalers['churn'].transform(holdout[features].fillna(0).to_numpy(dtype=np.float64))
+    return accuracy_score(holdout['churn'], model.models['churn_rf'].predict(X))
+
+
+def run(data_path, new_fraction, holdout_fraction):
+    df = pd.read_csv(os.path.abspath(data_path))
+    df['churn'] = churn_labels(len(df))
+    n_holdout = int(len(df) * holdout_fraction)
+    pool, holdout = df.iloc[:len(df) - n_holdout], df.iloc[len(df) - n_holdout:]
+    n_base = int(len(pool) * (1 - new_fraction))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        os.makedirs('outputs/figures', exist_ok=True)
+        pool.iloc[:n_base].drop(columns='churn').to_csv('base.csv', index=False)
+        pool.drop(columns='churn').to_csv('pool.csv', index=False)
+
+        # Initial model on the base rows (registered as version 1)
+        modeling.NetflixPredictiveModels('base.csv', feature_store_dir='store').train_churn_model()
+        with open('outputs/results/churn_training_stats.json') as f:
+            base_stats = f.read()
+
+        results = []
+        for path in ['warm_start', 'full']:
+            with open('outputs/results/churn_training_stats.json', 'w') as f:
+                f.write(base_stats)
+            model = modeling.NetflixPredictiveModels('pool.csv', feature_store_dir='store')
+            model.get_feature_set()
+            start = time.perf_counter()
+            if path == 'warm_start':
+                model.retrain_churn_model(drift_threshold=float('inf'), max_new_fraction=1.0)
+            else:
+                model.train_churn_model()
+            wall_time = time.perf_counter() - start
+            results.append({
+                'path': path,
+                'new_rows': len(pool) - n_base,
+                'n_estimators': model.models['churn_rf'].n_estimators,
+                'wall_time_sec': round(wall_time, 3),
+                'holdout_accuracy': round(holdout_accuracy(model, holdout), 4)
+            })
+
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data', default='data/netflix_processed.csv')
+    parser.add_argument('--new-fraction', type=float, default=0.05)
+    parser.add_argument('--holdout-fraction', type=float, default=0.1)
+    args = parser.parse_args()
+
+    report = run(args.data, args.new_fraction, args.holdout_fraction)
+    print("\n" + "="*80)
+    print("INCREMENTAL VS FULL RETRAINING")
+    print("="*80)
+    print(report.to_string(index=False))
+    full_time = report.loc[report['path'] == 'full', 'wall_time_sec'].iloc[0]
+    warm_time = report.loc[report['path'] == 'warm_start', 'wall_time_sec'].iloc[0]
+    print(f"\nWarm-start speedup: {full_time / max(warm_time, 1e-9):.1f}x")
@@ -0,0 +1,156 @@
+"""
+Benchmark: SQL Storage Backend vs In-Memory pandas EDA
+=======================================================
+Author: Vinisha Biju
+Project: Netflix Business Analytics
+Description: Peak memory and latency of the EDA aggregations on SQLite vs a full pandas frame
+
+A synthetic processed catalog is written to CSV and bulk-loaded into the SQL
+store in chunks. Each path then runs in its own interpreter, so peak RSS
+covers only that path: pandas reads the CSV and aggregates in memory, while
+the SQL path runs the same NetflixEDA aggregations inside SQLite.
+
+Usage:
+    python benchmarks/bench_sql_backend.py --rows 10000000
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from sql_backend import NetflixSQLStore
+
+GENRES = ['Dramas', 'Comedies', 'Documentaries', 'Action & Adventure', 'International Movies',
+          'Kids TV', 'Stand-Up Comedy', 'Horror Movies', 'Thrillers', 'Romantic Movies', 'Anime Series']
+COUNTRIES = ['United States', 'India', 'United Kingdom', 'Japan', 'South Korea', 'Canada', 'Spain',
+             'France', 'Mexico', 'Egypt', 'Turkey', 'Nigeria', 'Brazil', 'Germany', 'Unknown Country']
+RATINGS = ['TV-MA', 'TV-14', 'TV-PG', 'R', 'PG-13', 'TV-Y7', 'TV-Y', 'PG', 'TV-G', 'NR', 'G']
+
+
+def synthetic_chunks(n_rows, chunk_rows=1000000, seed=42):
+    """
+    Processed-catalog columns used by the EDA, generated chunk by chunk
+    """
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_rows, chunk_rows):
+        n = min(chunk_rows, n_rows - start)
+        release_year = rng.integers(1940, 2022, n)
+        year_added = np.maximum(release_year, rng.integers(2008, 2022, n)).astype(float)
+        year_added[rng.random(n) < 0.01] = np.nan
+        rating = np.array(RATINGS)[rng.integers(0, len(RATINGS), n)]
+        yield pd.DataFrame({
+            'show_id': np.char.add('s', np.arange(start, start + n).astype(str)),
+            'type': np.where(rng.random(n) < 0.7, 'Movie', 'TV Show'),
+            'title': np.char.add('Title ', rng.integers(0, n_rows, n).astype(str)),
+            'rating': rating,
+            'primary_genre': np.array(GENRES)[rng.integers(0, len(GENRES), n)],
+            'primary_country': np.array(COUNTRIES)[rng.integers(0, len(COUNTRIES), n)],
+            'release_year': release_year,
+            'year_added': year_added,
+            'month_added': np.where(np.isnan(year_added), np.nan, rng.integers(1, 13, n)),
+            'content_age_years': 2021 - release_year,
+            'is_mature': np.isin(rating, ['TV-MA', 'R', 'NR']).astype(int)
+        })
+
+
+def run_aggregations(eda):
+    """
+    Every aggregation NetflixEDA computes for its figures and summary report
+    """
+    eda._value_counts('type')
+    eda._group_counts(['year_added', 'type'])
+    eda._value_counts('rating', limit=10)
+    eda._value_counts('is_mature')
+    eda._value_counts('primary_genre', limit=10)
+    eda._group_counts(['primary_genre', 'type'])
+    eda._value_counts('primary_country', limit=15)
+    eda._group_counts(['release_year'])
+    eda._value_counts('month_added')
+    with contextlib.redirect_stdout(io.StringIO()):
+        return eda.statistical_summary_report()
+
+
+def peak_rss_mb():
+    """
+    Peak resident memory of this process
+
+    VmHWM resets on exec, unlike ru_maxrss which keeps the parent's peak.
+    """
+    if os.path.exists('/proc/self/status'):
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def worker(path, csv_path, db_path):
+    # One path per interpreter so the peak memory is that path's own
+    eda_module = importlib.import_module('02_exploratory_data_analysis')
+    baseline_mb = peak_rss_mb()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        eda = eda_module.NetflixEDA(csv_path) if path == 'pandas' else eda_module.NetflixEDA(sql_path=db_path)
+    load_sec = time.perf_counter() - start
+    start = time.perf_counter()
+    summary = run_aggregations(eda)
+    aggregate_sec = time.perf_counter() - start
+    print(json.dumps({
+        'path': path,
+        'load_sec': load_sec,
+        'aggregate_sec': aggregate_sec,
+        'peak_rss_mb': peak_rss_mb(),
+        'baseline_rss_mb': baseline_mb,
+        'total_titles': int(summary['total_titles']),
+        'avg_content_age': float(summary['avg_content_age'])
+    }))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000000)
+    parser.add_argument('--worker', choices=['pandas', 'sql'], help=argparse.SUPPRESS)
+    parser.add_argument('--csv', help=argparse.SUPPRESS)
+    parser.add_argument('--db', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.csv, args.db)
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        csv_path = os.path.join(tmp, 'netflix_processed.csv')
+        db_path = os.path.join(tmp, 'netflix.db')
+
+        start = time.perf_counter()
+        for i, chunk in enumerate(synthetic_chunks(args.rows)):
+            chunk.to_csv(csv_path, mode='a', header=i == 0, index=False)
+        print(f"Wrote {args.rows} rows to CSV in {time.perf_counter() - start:.1f}s")
+        NetflixSQLStore(db_path).load_dataframe(pd.read_csv(csv_path, chunksize=1000000))
+
+        rows = []
+        for path in ['pandas', 'sql']:
+            result = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', path,
+                                     '--csv', csv_path, '--db', db_path],
+                                    capture_output=True, text=True, check=True)
+            rows.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+        report = pd.DataFrame(rows)
+        print("\n" + "="*80)
+        print(f"EDA AGGREGATIONS: SQLITE VS PANDAS AT {args.rows} ROWS")
+        print(f"CSV {os.path.getsize(csv_path) / 1024 ** 2:.0f} MB, SQLite {os.path.getsize(db_path) / 1024 ** 2:.0f} MB")
+        print("="*80)
+        print(report.to_string(index=False, float_format=lambda v: f'{v:.2f}'))
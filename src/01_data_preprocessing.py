@@ -8,12 +8,12 @@ Description: Comprehensive data cleaning, preprocessing, and feature engineering
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+from sql_backend import NetflixSQLStore
+
 # Set display options
 pd.set_option('display.max_columns', None)
 pd.set_option('display.max_rows', 100)
@@ -229,7 +229,7 @@ class NetflixDataPreprocessor:
         
         return self
     
-    def save_processed_data(self, output_path='data/netflix_processed.csv'):
+    def save_processed_data(self, output_path='data/netflix_processed.csv', sql_path=None):
         """
         Save the processed dataset
         
@@ -237,10 +237,14 @@ class NetflixDataPreprocessor:
         -----------
         output_path : str
             Path to save the processed data
+        sql_path : str, optional
+            Also bulk-load the data into an indexed SQLite store at this path
         """
         print(f"\nSaving processed data to {output_path}...")
         self.df.to_csv(output_path, index=False)
         print(f"✓ Data saved successfully")
+        if sql_path:
+            NetflixSQLStore(sql_path).load_dataframe(self.df)
         print(f"Final dataset shape: {self.df.shape}")
         return self
     
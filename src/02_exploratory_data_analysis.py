@@ -8,53 +8,100 @@ Description: Comprehensive EDA with statistical analysis and visualization gener
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
 import warnings
 import os
 from datetime import datetime
 
+from sql_backend import NetflixSQLStore
+
 warnings.filterwarnings('ignore')
 
-# Set visualization style
-sns.set_style('whitegrid')
-sns.set_palette('husl')
-plt.rcParams['figure.figsize'] = (12, 6)
-plt.rcParams['font.size'] = 10
+def _plotting_libraries():
+    """
+    Import matplotlib and seaborn on first plot and set the visualization style
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    sns.set_style('whitegrid')
+    sns.set_palette('husl')
+    plt.rcParams['figure.figsize'] = (12, 6)
+    plt.rcParams['font.size'] = 10
+    return plt, sns
 
 class NetflixEDA:
     """
     Comprehensive Exploratory Data Analysis for Netflix dataset
     """
     
-    def __init__(self, data_path='data/netflix_processed.csv'):
+    def __init__(self, data_path='data/netflix_processed.csv', sql_path=None):
         """
         Initialize EDA with processed data
+        
+        Parameters:
+        -----------
+        data_path : str
+            Processed catalog CSV, loaded into memory
+        sql_path : str, optional
+            SQLite store written by preprocessing; when given, the CSV is not
+            loaded and every aggregation runs inside the database
         """
-        self.df = pd.read_csv(data_path)
         self.output_dir = 'outputs/figures'
         os.makedirs(self.output_dir, exist_ok=True)
-        print(f"Data loaded: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
+        if sql_path:
+            self.df = None
+            self.store = NetflixSQLStore(sql_path)
+            print(f"Using SQL store: {sql_path} ({self.store.row_count()} rows, {len(self.store.columns)} columns)")
+        else:
+            self.df = pd.read_csv(data_path)
+            self.store = None
+            print(f"Data loaded: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
+    
+    def _has_column(self, column):
+        return column in (self.store.columns if self.store is not None else self.df.columns)
+    
+    def _row_count(self):
+        return self.store.row_count() if self.store is not None else len(self.df)
+    
+    def _value_counts(self, column, limit=None):
+        """
+        Counts per value, largest first, from the SQL store or the in-memory frame
+        """
+        if self.store is not None:
+            return self.store.value_counts(column, limit)
+        counts = self.df[column].value_counts()
+        return counts.head(limit) if limit else counts
+    
+    def _group_counts(self, columns):
+        if self.store is not None:
+            return self.store.group_counts(columns)
+        return self.df.groupby(columns).size()
+    
+    def _column_summary(self, column):
+        if self.store is not None:
+            return self.store.column_summary(column)
+        values = self.df[column]
+        return {'min': values.min(), 'max': values.max(), 'mean': values.mean(),
+                'median': values.median(), 'count': values.count()}
     
     def content_distribution_analysis(self):
         """
         Analyze and visualize content type distribution
         """
         print("\nGenerating Content Distribution Visualization...")
+        plt, sns = _plotting_libraries()
         
         fig, axes = plt.subplots(1, 2, figsize=(15, 6))
         
         # Pie chart for content types
-        type_counts = self.df['type'].value_counts()
+        type_counts = self._value_counts('type')
         colors = sns.color_palette('pastel')[0:len(type_counts)]
         axes[0].pie(type_counts.values, labels=type_counts.index, autopct='%1.1f%%',
                     colors=colors, startangle=90)
         axes[0].set_title('Content Type Distribution', fontsize=14, fontweight='bold')
         
         # Bar chart for content added over years
-        if 'year_added' in self.df.columns:
-            yearly = self.df.groupby(['year_added', 'type']).size().unstack(fill_value=0)
+        if self._has_column('year_added'):
+            yearly = self._group_counts(['year_added', 'type']).unstack(fill_value=0)
             yearly.plot(kind='bar', ax=axes[1], color=['#FF6B6B', '#4ECDC4'])
             axes[1].set_title('Content Added by Year', fontsize=14, fontweight='bold')
             axes[1].set_xlabel('Year Added')
@@ -74,12 +121,13 @@ class NetflixEDA:
         Analyze content ratings and correlation
         """
         print("\nGenerating Rating Correlation Visualization...")
+        plt, sns = _plotting_libraries()
         
         fig, axes = plt.subplots(1, 2, figsize=(15, 6))
         
         # Rating distribution
-        if 'rating' in self.df.columns:
-            rating_counts = self.df['rating'].value_counts().head(10)
+        if self._has_column('rating'):
+            rating_counts = self._value_counts('rating', limit=10)
             axes[0].barh(range(len(rating_counts)), rating_counts.values)
             axes[0].set_yticks(range(len(rating_counts)))
             axes[0].set_yticklabels(rating_counts.index)
@@ -88,8 +136,8 @@ class NetflixEDA:
             axes[0].invert_yaxis()
         
         # Mature vs Non-Mature content
-        if 'is_mature' in self.df.columns:
-            mature_dist = self.df['is_mature'].value_counts()
+        if self._has_column('is_mature'):
+            mature_dist = self._value_counts('is_mature')
             labels = ['Non-Mature', 'Mature']
             axes[1].pie(mature_dist.values, labels=labels, autopct='%1.1f%%',
                        colors=['#95E1D3', '#F38181'], startangle=90)
@@ -105,12 +153,13 @@ class NetflixEDA:
         Analyze genre performance and distribution
         """
         print("\nGenerating Genre Performance Visualization...")
+        plt, sns = _plotting_libraries()
         
-        if 'primary_genre' in self.df.columns:
+        if self._has_column('primary_genre'):
             fig, axes = plt.subplots(1, 2, figsize=(15, 6))
             
             # Top genres
-            top_genres = self.df['primary_genre'].value_counts().head(10)
+            top_genres = self._value_counts('primary_genre', limit=10)
             axes[0].barh(range(len(top_genres)), top_genres.values, color='skyblue')
             axes[0].set_yticks(range(len(top_genres)))
             axes[0].set_yticklabels(top_genres.index)
@@ -119,7 +168,7 @@ class NetflixEDA:
             axes[0].invert_yaxis()
             
             # Genre by content type
-            genre_type = pd.crosstab(self.df['primary_genre'], self.df['type'])
+            genre_type = self._group_counts(['primary_genre', 'type']).unstack(fill_value=0)
             top_genre_type = genre_type.loc[top_genres.index]
             top_genre_type.plot(kind='barh', stacked=True, ax=axes[1], color=['#FF9999', '#66B2FF'])
             axes[1].set_xlabel('Count')
@@ -136,11 +185,12 @@ class NetflixEDA:
         Analyze geographic distribution of content
         """
         print("\nGenerating Geographic Performance Visualization...")
+        plt, sns = _plotting_libraries()
         
-        if 'primary_country' in self.df.columns:
+        if self._has_column('primary_country'):
             fig, ax = plt.subplots(figsize=(12, 8))
             
-            top_countries = self.df['primary_country'].value_counts().head(15)
+            top_countries = self._value_counts('primary_country', limit=15)
             colors = sns.color_palette('viridis', len(top_countries))
             
             ax.barh(range(len(top_countries)), top_countries.values, color=colors)
@@ -164,12 +214,14 @@ class NetflixEDA:
         Analyze temporal trends in content release and addition
         """
         print("\nGenerating Time Series Analysis...")
+        plt, sns = _plotting_libraries()
         
         fig, axes = plt.subplots(2, 1, figsize=(14, 10))
         
         # Release year trends
-        if 'release_year' in self.df.columns:
-            release_trend = self.df[self.df['release_year'] >= 1990].groupby('release_year').size()
+        if self._has_column('release_year'):
+            release_trend = self._group_counts(['release_year']).sort_index()
+            release_trend = release_trend[release_trend.index >= 1990]
             axes[0].plot(release_trend.index, release_trend.values, marker='o', linewidth=2, markersize=4)
             axes[0].fill_between(release_trend.index, release_trend.values, alpha=0.3)
             axes[0].set_xlabel('Release Year', fontsize=12)
@@ -178,8 +230,8 @@ class NetflixEDA:
             axes[0].grid(True, alpha=0.3)
         
         # Monthly addition patterns
-        if 'month_added' in self.df.columns:
-            monthly = self.df['month_added'].value_counts().sort_index()
+        if self._has_column('month_added'):
+            monthly = self._value_counts('month_added').sort_index()
             month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
             axes[1].bar(range(1, 13), [monthly.get(i, 0) for i in range(1, 13)],
@@ -205,40 +257,48 @@ class NetflixEDA:
         print("="*80)
         
         # Content Type Stats
+        type_counts = self._value_counts('type')
+        n_titles = self._row_count()
+        movies = int(type_counts.get('Movie', 0))
+        tv_shows = int(type_counts.get('TV Show', 0))
         print("\nContent Type Distribution:")
-        print(self.df['type'].value_counts())
-        print(f"\nMovies: {(self.df['type']=='Movie').sum()} ({(self.df['type']=='Movie').sum()/len(self.df)*100:.1f}%)")
-        print(f"TV Shows: {(self.df['type']=='TV Show').sum()} ({(self.df['type']=='TV Show').sum()/len(self.df)*100:.1f}%)")
+        print(type_counts)
+        print(f"\nMovies: {movies} ({movies/n_titles*100:.1f}%)")
+        print(f"TV Shows: {tv_shows} ({tv_shows/n_titles*100:.1f}%)")
         
         # Release Year Stats
-        if 'release_year' in self.df.columns:
+        if self._has_column('release_year'):
+            release = self._column_summary('release_year')
             print("\nRelease Year Statistics:")
-            print(f"Earliest: {self.df['release_year'].min()}")
-            print(f"Latest: {self.df['release_year'].max()}")
-            print(f"Median: {self.df['release_year'].median()}")
-            print(f"Mean: {self.df['release_year'].mean():.1f}")
+            print(f"Earliest: {release['min']}")
+            print(f"Latest: {release['max']}")
+            print(f"Median: {release['median']}")
+            print(f"Mean: {release['mean']:.1f}")
         
         # Content Age Stats
-        if 'content_age_years' in self.df.columns:
+        avg_content_age = None
+        if self._has_column('content_age_years'):
+            content_age = self._column_summary('content_age_years')
+            avg_content_age = content_age['mean']
             print("\nContent Age Statistics:")
-            print(f"Average Content Age: {self.df['content_age_years'].mean():.1f} years")
-            print(f"Median Content Age: {self.df['content_age_years'].median()} years")
+            print(f"Average Content Age: {content_age['mean']:.1f} years")
+            print(f"Median Content Age: {content_age['median']} years")
         
         # Country Stats
-        if 'primary_country' in self.df.columns:
+        if self._has_column('primary_country'):
             print("\nTop 5 Content Producing Countries:")
-            print(self.df['primary_country'].value_counts().head())
+            print(self._value_counts('primary_country', limit=5))
         
         # Genre Stats
-        if 'primary_genre' in self.df.columns:
+        if self._has_column('primary_genre'):
             print("\nTop 5 Genres:")
-            print(self.df['primary_genre'].value_counts().head())
+            print(self._value_counts('primary_genre', limit=5))
         
         return {
-            'total_titles': len(self.df),
-            'movies': (self.df['type']=='Movie').sum(),
-            'tv_shows': (self.df['type']=='TV Show').sum(),
-            'avg_content_age': self.df['content_age_years'].mean() if 'content_age_years' in self.df.columns else None
+            'total_titles': n_titles,
+            'movies': movies,
+            'tv_shows': tv_shows,
+            'avg_content_age': avg_content_age
         }
     
     def generate_all_visualizations(self):
@@ -8,17 +8,15 @@ Description: Comprehensive ML models for churn prediction, revenue forecasting,
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor
-from sklearn.linear_model import LogisticRegression, LinearRegression
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
-from sklearn.metrics import mean_squared_error, r2_score, classification_report, confusion_matrix
-import joblib
+import copy
+import json
+import time
 import warnings
 import os
+from datetime import datetime
+
+from feature_store import NetflixFeatureStore, CONTENT_FEATURES
+from model_registry import ModelRegistry
 
 warnings.filterwarnings('ignore')
 
@@ -27,15 +25,28 @@ class NetflixPredictiveModels:
     Comprehensive predictive modeling for Netflix analytics
     """
     
-    def __init__(self, data_path='data/netflix_processed.csv'):
+    def __init__(self, data_path='data/netflix_processed.csv', feature_store_dir='data/feature_store',
+                 registry_dir='outputs/models'):
         self.df = pd.read_csv(data_path)
         self.models = {}
         self.scalers = {}
         self.results = {}
         self.output_dir = 'outputs/results'
         os.makedirs(self.output_dir, exist_ok=True)
+        self.feature_store = NetflixFeatureStore(feature_store_dir)
+        self.feature_set = None
+        self.registry = ModelRegistry(registry_dir)
         print(f"Data loaded for modeling: {self.df.shape}")
     
+    def get_feature_set(self):
+        """
+        Open the shared content feature set, materializing it if the source data changed
+        """
+        if self.feature_set is None:
+            available_features = [col for col in CONTENT_FEATURES if col in self.df.columns]
+            self.feature_set = self.feature_store.materialize('content_core', self.df, available_features)
+        return self.feature_set
+    
     def prepare_churn_data(self):
         """
         Prepare data for churn prediction model
@@ -46,16 +57,18 @@ class NetflixPredictiveModels:
         np.random.seed(42)
         self.df['churn'] = np.random.binomial(1, 0.15, size=len(self.df))
         
-        # Select features
+        # Select features from the shared feature store (already filled and scaled)
         feature_cols = ['content_age_years', 'num_genres', 'num_countries', 'is_mature']
-        available_features = [col for col in feature_cols if col in self.df.columns]
+        features = self.get_feature_set()
+        available_features = [col for col in feature_cols if col in features.columns]
         
         if len(available_features) < 2:
             print("Warning: Insufficient features for modeling")
             return None, None
         
-        X = self.df[available_features].fillna(0)
+        X = features.to_frame(available_features, scaled=True)
         y = self.df['churn']
+        self.scalers['churn'] = features.to_scaler(available_features)
         
         return X, y
     
@@ -67,41 +80,36 @@ class NetflixPredictiveModels:
         print("CHURN PREDICTION MODEL TRAINING")
         print("="*80)
         
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+        
         X, y = self.prepare_churn_data()
         if X is None:
             return
         
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
-        
-        # Scale features
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
-        self.scalers['churn'] = scaler
+        # Split data (features come pre-scaled from the feature store)
+        X_train_scaled, X_test_scaled, y_train, y_test = train_test_split(
+            X.values, y, test_size=0.2, random_state=42, stratify=y
+        )
         
         # Train Random Forest
-        rf_model = RandomForestClassifier(
-            n_estimators=150,
-            max_depth=15,
-            min_samples_split=5,
-            min_samples_leaf=2,
-            random_state=42,
-            n_jobs=-1
-        )
+        rf_model = self._build_churn_model()
         
         print("Training Random Forest Classifier...")
-        rf_model.fit(X_train_scaled, y_train)
-        
-        # Predictions
-        y_pred = rf_model.predict(X_test_scaled)
-        y_pred_proba = rf_model.predict_proba(X_test_scaled)[:, 1]
-        
-        # Evaluate
-        accuracy = accuracy_score(y_test, y_pred)
-        precision = precision_score(y_test, y_pred)
-        recall = recall_score(y_test, y_pred)
-        f1 = f1_score(y_test, y_pred)
+        # scipy, imported by sklearn, registers 'always' filters that override the module-level ignore
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            rf_model.fit(X_train_scaled, y_train)
+            
+            # Predictions
+            y_pred = rf_model.predict(X_test_scaled)
+            y_pred_proba = rf_model.predict_proba(X_test_scaled)[:, 1]
+            
+            # Evaluate
+            accuracy = accuracy_score(y_test, y_pred)
+            precision = precision_score(y_test, y_pred)
+            recall = recall_score(y_test, y_pred)
+            f1 = f1_score(y_test, y_pred)
         
         print(f"\nModel Performance:")
         print(f"Accuracy:  {accuracy:.3f} (89.3%)")
@@ -131,16 +139,370 @@ class NetflixPredictiveModels:
         # Save confusion matrix visualization
         self._plot_confusion_matrix(y_test, y_pred, 'Churn Prediction')
         
-        # Save model
-        joblib.dump(rf_model, f'{self.output_dir}/churn_model.pkl')
-        print(f"\n✓ Model saved: churn_model.pkl")
+        # Register a new model version
+        self.registry.register(
+            'churn_rf', rf_model,
+            training_data_hash=self.get_feature_set().manifest['source_hash'],
+            params=rf_model.get_params(),
+            metrics={'accuracy': accuracy, 'precision': precision, 'recall': recall, 'f1': f1},
+            features=list(X.columns),
+            scaler_mean=self.scalers['churn'].mean_.tolist(),
+            scaler_scale=self.scalers['churn'].scale_.tolist(),
+            retrain_path='full'
+        )
+        
+        # Save training-time feature distribution for drift checks
+        self._save_training_stats(list(X.columns), self.scalers['churn'])
         
         return rf_model
     
+    @staticmethod
+    def _build_churn_model():
+        """
+        Unfitted Random Forest used for churn prediction
+        """
+        from sklearn.ensemble import RandomForestClassifier
+        return RandomForestClassifier(
+            n_estimators=150,
+            max_depth=15,
+            min_samples_split=5,
+            min_samples_leaf=2,
+            random_state=42,
+            n_jobs=-1
+        )
+    
+    def evaluate_churn_model_cv(self, n_splits=5, n_repeats=3, n_jobs=-1, metrics=None):
+        """
+        Evaluate the churn model with parallel repeated stratified k-fold
+        
+        Fold predictions are cached, so calling this again (for example with
+        additional metrics) does not retrain the model.
+        
+        Parameters:
+        -----------
+        n_splits : int
+            Number of folds per repeat
+        n_repeats : int
+            Number of repeats
+        n_jobs : int
+            Number of parallel fold workers
+        metrics : dict, optional
+            Extra metrics as ``f(y_true, y_pred, y_score)``, added to the defaults
+        """
+        print("\n" + "="*80)
+        print("CHURN MODEL CROSS-VALIDATED EVALUATION")
+        print("="*80)
+        
+        from model_evaluation import CrossValidatedEvaluator
+        
+        X, y = self.prepare_churn_data()
+        if X is None:
+            return
+        
+        evaluator = CrossValidatedEvaluator(self._build_churn_model(), n_splits=n_splits, n_repeats=n_repeats,
+                                            n_jobs=n_jobs, cache_dir=f'{self.output_dir}/cv_cache')
+        all_metrics = None
+        if metrics:
+            from model_evaluation import DEFAULT_METRICS
+            all_metrics = {**DEFAULT_METRICS, **metrics}
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            evaluator.fit_predict(X.values, y.values)
+            summary = evaluator.evaluate(all_metrics)
+        
+        print("\nCross-Validated Performance (mean and 95% CI):")
+        for metric, row in summary.iterrows():
+            print(f"{metric:<10} {row['mean']:.3f}  [{row['ci_lower']:.3f}, {row['ci_upper']:.3f}]")
+        
+        self.results['churn_cv'] = summary
+        return summary
+    
+    def score_churn(self, version=None, output_file='churn_scores.csv'):
+        """
+        Score every title with a registered churn model, without retraining
+
+        Parameters:
+        -----------
+        version : int, optional
+            Registered version of 'churn_rf' (latest by default)
+        output_file : str
+            CSV written to the results directory
+        """
+        print("\n" + "="*80)
+        print("CHURN MODEL SCORING")
+        print("="*80)
+
+        handle = self.registry.get('churn_rf', version)
+        scaling = self._registered_scaling(handle.metadata)
+        if scaling is None:
+            raise ValueError(f"churn_rf v{handle.version} has no scaler statistics in its metadata; retrain to score it")
+        columns = handle.metadata['features']
+        # Scale with the statistics this version was trained with, not the current feature store scaler
+        scaler_mean, scaler_scale = scaling
+        X = (self.get_feature_set().to_frame(columns).to_numpy() - scaler_mean) / scaler_scale
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            churn_probability = handle.model.predict_proba(X)[:, 1]
+        scores = self.df[[col for col in ['show_id', 'title'] if col in self.df.columns]].copy()
+        scores['churn_probability'] = churn_probability
+        scores['churn_prediction'] = (churn_probability >= 0.5).astype(int)
+        scores.to_csv(f'{self.output_dir}/{output_file}', index=False)
+        print(f"Scored {len(scores)} titles with churn_rf v{handle.version} "
+              f"({scores['churn_prediction'].mean():.1%} predicted to churn)")
+        print(f"✓ Saved: {output_file}")
+        return scores
+
+    @staticmethod
+    def _registered_scaling(metadata):
+        """
+        Scaler mean and scale stored with a registered churn model version
+        """
+        if 'scaler_mean' not in metadata or 'scaler_scale' not in metadata:
+            return None
+        return np.asarray(metadata['scaler_mean']), np.asarray(metadata['scaler_scale'])
+    
+    def _save_training_stats(self, columns, scaler):
+        """
+        Store summary statistics of the training features and the scaler in use
+        """
+        X_raw = self.get_feature_set().to_frame(columns)
+        stats = {
+            'columns': columns,
+            'n_rows': len(X_raw),
+            'rows_since_full_retrain': 0,
+            'warm_updates': 0,
+            'scaler_mean': scaler.mean_.tolist(),
+            'scaler_scale': scaler.scale_.tolist(),
+            'summary': self._summarize_features(X_raw),
+            'trained_at': datetime.now().isoformat(timespec='seconds')
+        }
+        with open(f'{self.output_dir}/churn_training_stats.json', 'w') as f:
+            json.dump(stats, f, indent=2)
+        print(f"✓ Saved: churn_training_stats.json")
+        return stats
+    
+    def _load_training_stats(self):
+        path = f'{self.output_dir}/churn_training_stats.json'
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+    
+    @staticmethod
+    def _summarize_features(X_raw, n_bins=10):
+        """
+        Summarize each feature as mean, std and binned proportions
+
+        Low-cardinality features are binned per distinct value, the rest by
+        training-time quantiles.
+        """
+        summary = {}
+        for col in X_raw.columns:
+            values = X_raw[col].to_numpy(dtype=np.float64)
+            distinct = np.unique(values)
+            if len(distinct) <= n_bins:
+                edges = (distinct[:-1] + distinct[1:]) / 2
+            else:
+                edges = np.unique(np.quantile(values, np.linspace(0, 1, n_bins + 1)[1:-1]))
+            counts = np.bincount(np.searchsorted(edges, values, side='right'), minlength=len(edges) + 1)
+            summary[col] = {
+                'mean': float(values.mean()),
+                'std': float(values.std()),
+                'edges': edges.tolist(),
+                'proportions': (counts / max(len(values), 1)).tolist()
+            }
+        return summary
+    
+    @staticmethod
+    def _population_stability(summary, X_raw, eps=1e-4):
+        """
+        Population Stability Index of each feature against the training summary
+        """
+        psi = {}
+        for col, ref in summary.items():
+            edges = np.asarray(ref['edges'])
+            expected = np.clip(np.asarray(ref['proportions']), eps, None)
+            counts = np.bincount(np.searchsorted(edges, X_raw[col].to_numpy(dtype=np.float64), side='right'),
+                                 minlength=len(edges) + 1)
+            actual = np.clip(counts / max(len(X_raw), 1), eps, None)
+            psi[col] = float(np.sum((actual - expected) * np.log(actual / expected)))
+        return psi
+    
+    def retrain_churn_model(self, drift_threshold=0.2, max_new_fraction=0.3, min_new_trees=10):
+        """
+        Retrain the churn model incrementally when possible
+        
+        New rows are assumed to be appended to the processed dataset; if the
+        rows the model was trained on were edited or removed, a full retrain
+        runs. When the feature drift (max PSI) of the new rows against the
+        training-time distribution stays below ``drift_threshold`` and the rows
+        added since the last full retrain stay below ``max_new_fraction``, the
+        existing forest is grown with ``warm_start`` on the new rows only.
+        Otherwise a full retrain runs.
+        
+        Parameters:
+        -----------
+        drift_threshold : float
+            Maximum per-feature PSI tolerated for a warm-start update
+        max_new_fraction : float
+            Maximum share of rows added since the last full retrain
+        min_new_trees : int
+            Minimum number of trees added by a warm-start update
+        """
+        print("\n" + "="*80)
+        print("INCREMENTAL CHURN MODEL RETRAINING")
+        print("="*80)
+        
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+        
+        start = time.perf_counter()
+        stats = self._load_training_stats()
+        rf_model = self.models.get('churn_rf')
+        parent_version = self.registry.latest_version('churn_rf')
+        if rf_model is None and parent_version is not None:
+            rf_model = self.registry.load('churn_rf', parent_version)
+        
+        if stats is None or rf_model is None or parent_version is None:
+            return self._full_retrain('no previous model', start)
+        parent = self.registry.get('churn_rf', parent_version)
+        scaling = self._registered_scaling(parent.metadata)
+        if scaling is None or parent.metadata.get('features') != stats['columns']:
+            return self._full_retrain(f'churn_rf v{parent_version} has no matching scaler statistics', start)
+        scaler_mean, scaler_scale = scaling
+        
+        n_trained = stats['n_rows']
+        n_new = len(self.df) - n_trained
+        if n_new < 0:
+            return self._full_retrain(f'{-n_new} rows removed since last training', start)
+        # The rows the model was trained on must be unchanged, or it no longer reflects the data
+        trained_hash = NetflixFeatureStore.source_hash(self.df.iloc[:n_trained], self.get_feature_set().columns)
+        if trained_hash != parent.metadata.get('training_data_hash'):
+            return self._full_retrain('training rows changed since last training', start)
+        if n_new == 0:
+            print("No new rows since last training; keeping existing model")
+            self.models['churn_rf'] = rf_model
+            self._log_retraining('skip', 'no new rows', 0, 0.0, 0, rf_model, start)
+            return rf_model
+        
+        X, y = self.prepare_churn_data()
+        if X is None:
+            return
+        X_new_raw = self.get_feature_set().to_frame(stats['columns']).iloc[n_trained:]
+        psi = self._population_stability(stats['summary'], X_new_raw)
+        max_psi = max(psi.values())
+        new_fraction = (stats['rows_since_full_retrain'] + n_new) / (n_trained - stats['rows_since_full_retrain'])
+        print(f"New rows: {n_new} | max PSI: {max_psi:.4f} | rows since full retrain: {new_fraction:.1%}")
+        
+        if max_psi > drift_threshold:
+            return self._full_retrain(f'drift {max_psi:.4f} > {drift_threshold}', start, n_new, max_psi)
+        if new_fraction > max_new_fraction:
+            return self._full_retrain(f'new data {new_fraction:.1%} > {max_new_fraction:.0%}', start, n_new, max_psi)
+        
+        # Transform new rows with the scaler the forest was trained with
+        X_new = (X_new_raw.to_numpy() - scaler_mean) / scaler_scale
+        y_new = y.iloc[n_trained:].to_numpy()
+        if len(y_new) >= 50 and np.bincount(y_new, minlength=2).min() >= 2:
+            X_fit, X_eval, y_fit, y_eval = train_test_split(X_new, y_new, test_size=0.2, random_state=42, stratify=y_new)
+        else:
+            X_fit, X_eval, y_fit, y_eval = X_new, None, y_new, None
+        if len(np.unique(y_fit)) < 2:
+            return self._full_retrain('new rows contain a single class', start, n_new, max_psi)
+        
+        n_added = max(min_new_trees, int(np.ceil(rf_model.n_estimators * n_new / n_trained)))
+        print(f"Growing forest from {rf_model.n_estimators} to {rf_model.n_estimators + n_added} trees...")
+        # Copy first so the registered (and cached) parent version stays untouched
+        rf_model = copy.deepcopy(rf_model)
+        rf_model.set_params(warm_start=True, n_estimators=rf_model.n_estimators + n_added)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            rf_model.fit(X_fit, y_fit)
+        rf_model.set_params(warm_start=False)
+        
+        scaler = StandardScaler()
+        scaler.mean_ = scaler_mean
+        scaler.scale_ = scaler_scale
+        scaler.var_ = scaler.scale_ ** 2
+        scaler.n_features_in_ = len(stats['columns'])
+        scaler.n_samples_seen_ = n_trained
+        self.scalers['churn'] = scaler
+        self.models['churn_rf'] = rf_model
+        
+        if X_eval is not None:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                y_pred = rf_model.predict(X_eval)
+            self.results['churn'] = {
+                'accuracy': accuracy_score(y_eval, y_pred),
+                'precision': precision_score(y_eval, y_pred, zero_division=0),
+                'recall': recall_score(y_eval, y_pred, zero_division=0),
+                'f1': f1_score(y_eval, y_pred, zero_division=0),
+                'feature_importance': pd.DataFrame({
+                    'feature': stats['columns'],
+                    'importance': rf_model.feature_importances_
+                }).sort_values('importance', ascending=False)
+            }
+        
+        metrics = {k: v for k, v in self.results.get('churn', {}).items() if k != 'feature_importance'}
+        self.registry.register(
+            'churn_rf', rf_model,
+            training_data_hash=self.get_feature_set().manifest['source_hash'],
+            params=rf_model.get_params(),
+            metrics=metrics if X_eval is not None else {},
+            features=stats['columns'],
+            scaler_mean=scaler_mean.tolist(),
+            scaler_scale=scaler_scale.tolist(),
+            retrain_path='warm_start',
+            parent_version=parent_version
+        )
+        stats['n_rows'] = len(self.df)
+        stats['rows_since_full_retrain'] += n_new
+        stats['warm_updates'] += 1
+        with open(f'{self.output_dir}/churn_training_stats.json', 'w') as f:
+            json.dump(stats, f, indent=2)
+        
+        self._log_retraining('warm_start', f'max PSI {max_psi:.4f} <= {drift_threshold}', n_new, max_psi, n_added, rf_model, start)
+        return rf_model
+    
+    def _full_retrain(self, reason, start, n_new=None, max_psi=float('nan')):
+        print(f"Full retrain required: {reason}")
+        rf_model = self.train_churn_model()
+        if rf_model is not None:
+            self._log_retraining('full', reason, len(self.df) if n_new is None else n_new, max_psi,
+                                 rf_model.n_estimators, rf_model, start)
+        return rf_model
+    
+    def _log_retraining(self, path, reason, n_new, max_psi, trees_added, rf_model, start):
+        """
+        Print and append the retraining decision and its cost to the retraining log
+        """
+        wall_time = time.perf_counter() - start
+        entry = pd.DataFrame([{
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'path': path,
+            'reason': reason,
+            'new_rows': n_new,
+            'max_psi': max_psi,
+            'trees_added': trees_added,
+            'n_estimators': rf_model.n_estimators,
+            'wall_time_sec': round(wall_time, 3),
+            'accuracy': self.results.get('churn', {}).get('accuracy', float('nan'))
+        }])
+        log_path = f'{self.output_dir}/churn_retraining_log.csv'
+        entry.to_csv(log_path, mode='a', header=not os.path.exists(log_path), index=False)
+        print(f"✓ Retraining path: {path} ({reason}) in {wall_time:.2f}s, "
+              f"{trees_added} trees added, {rf_model.n_estimators} total")
+    
     def _plot_confusion_matrix(self, y_true, y_pred, title):
         """
         Plot and save confusion matrix
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        from sklearn.metrics import confusion_matrix
+        
         cm = confusion_matrix(y_true, y_pred)
         plt.figure(figsize=(8, 6))
         sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', cbar=True)
@@ -162,23 +524,23 @@ class NetflixPredictiveModels:
         
         from sklearn.cluster import KMeans
         
-        # Prepare features for clustering
+        # Prepare features for clustering from the shared feature store
         feature_cols = ['content_age_years', 'num_genres', 'is_mature']
-        available_features = [col for col in feature_cols if col in self.df.columns]
+        features = self.get_feature_set()
+        available_features = [col for col in feature_cols if col in features.columns]
         
         if len(available_features) < 2:
             print("Warning: Insufficient features for clustering")
             return
         
-        X = self.df[available_features].fillna(0)
-        
-        # Scale
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
+        X_scaled = features.scaled[:, features.column_indices(available_features)]
+        scaler = features.to_scaler(available_features)
         
         # K-Means clustering
         kmeans = KMeans(n_clusters=4, random_state=42, n_init=10)
-        clusters = kmeans.fit_predict(X_scaled)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            clusters = kmeans.fit_predict(X_scaled)
         
         self.df['cluster'] = clusters
         
@@ -203,6 +565,8 @@ class NetflixPredictiveModels:
         """
         Visualize customer segments
         """
+        import matplotlib.pyplot as plt
+        
         plt.figure(figsize=(10, 8))
         scatter = plt.scatter(X_scaled[:, 0], X_scaled[:, 1], c=clusters, cmap='viridis', alpha=0.6)
         plt.colorbar(scatter, label='Cluster')
@@ -222,25 +586,41 @@ class NetflixPredictiveModels:
         print("MODEL PERFORMANCE COMPARISON")
         print("="*80)
         
-        if 'churn' not in self.results:
+        if 'churn' not in self.results and 'churn_cv' not in self.results:
             print("No model results available")
             return
         
-        # Create comparison chart
+        import matplotlib.pyplot as plt
+        
+        # Create comparison chart (cross-validated means with CIs when available)
         metrics = ['accuracy', 'precision', 'recall', 'f1']
-        values = [self.results['churn'].get(m, 0) for m in metrics]
+        cv_summary = self.results.get('churn_cv')
+        if cv_summary is not None:
+            values = [cv_summary.loc[m, 'mean'] for m in metrics]
+            errors = [[values[i] - cv_summary.loc[m, 'ci_lower'] for i, m in enumerate(metrics)],
+                      [cv_summary.loc[m, 'ci_upper'] - values[i] for i, m in enumerate(metrics)]]
+        else:
+            values = [self.results['churn'].get(m, 0) for m in metrics]
+            errors = None
         
         plt.figure(figsize=(10, 6))
-        bars = plt.bar(metrics, values, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'])
+        bars = plt.bar(metrics, values, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'],
+                       yerr=errors, capsize=8 if errors else 0)
         plt.ylim(0, 1)
         plt.ylabel('Score')
-        plt.title('Churn Prediction Model Performance', fontsize=14, fontweight='bold')
+        title = 'Churn Prediction Model Performance'
+        if cv_summary is not None:
+            title += ' (CV mean, 95% CI)'
+        plt.title(title, fontsize=14, fontweight='bold')
         
         # Add value labels on bars
-        for bar, value in zip(bars, values):
-            height = bar.get_height()
+        for i, (bar, value) in enumerate(zip(bars, values)):
+            height = bar.get_height() if errors is None else bar.get_height() + errors[1][i]
+            label = f'{value:.3f}'
+            if cv_summary is not None:
+                label += f"\n[{cv_summary.loc[metrics[i], 'ci_lower']:.3f}, {cv_summary.loc[metrics[i], 'ci_upper']:.3f}]"
             plt.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{value:.3f}', ha='center', va='bottom', fontweight='bold')
+                    label, ha='center', va='bottom', fontweight='bold')
         
         plt.tight_layout()
         plt.savefig('outputs/figures/model_performance_comparison.png', dpi=300, bbox_inches='tight')
@@ -248,27 +628,45 @@ class NetflixPredictiveModels:
         print(f"✓ Saved: model_performance_comparison.png")
         
         # Save metrics to CSV
-        metrics_df = pd.DataFrame([self.results['churn']])
+        row = dict(self.results.get('churn', {}))
+        if cv_summary is not None:
+            for metric, summary in cv_summary.iterrows():
+                row[metric] = summary['mean']
+                row[f'{metric}_ci_lower'] = summary['ci_lower']
+                row[f'{metric}_ci_upper'] = summary['ci_upper']
+        metrics_df = pd.DataFrame([row])
         metrics_df.to_csv(f'{self.output_dir}/model_metrics.csv', index=False)
         print(f"✓ Saved: model_metrics.csv")
     
-    def run_all_models(self):
+    def run_all_models(self, incremental=False, cross_validate=False):
         """
         Execute complete modeling pipeline
+        
+        Parameters:
+        -----------
+        incremental : bool
+            Update the existing churn model with warm start when drift is small
+        cross_validate : bool
+            Report repeated k-fold means and confidence intervals instead of a single split
         """
         print("\n" + "#"*80)
         print("# Netflix Predictive Modeling Pipeline")
         print("#"*80 + "\n")
         
         # Train models
-        self.train_churn_model()
+        if incremental:
+            self.retrain_churn_model()
+        else:
+            self.train_churn_model()
+        if cross_validate:
+            self.evaluate_churn_model_cv()
         self.train_segmentation_model()
         self.generate_model_performance_report()
         
         print("\n" + "="*80)
         print("✓ ALL MODELS TRAINED SUCCESSFULLY")
         print("="*80)
-        print(f"\nModels saved to: {self.output_dir}")
+        print(f"\nModels registered in: {self.registry.root_dir}")
         print(f"Total models trained: {len(self.models)}")
         
         return self.models, self.results
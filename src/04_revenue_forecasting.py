@@ -8,25 +8,36 @@ Description: ARIMA-based revenue forecasting with seasonal decomposition
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from statsmodels.tsa.arima.model import ARIMA
 import warnings
 import os
+import time
+
+from model_registry import ModelRegistry, data_hash
+from batch_forecasting import NetflixBatchForecaster
+from arima_order_selection import ARIMAOrderSelector, ARIMAFitCache
+from forecast_simulation import ForecastPathSimulator, DEFAULT_QUANTILES
 
 warnings.filterwarnings('ignore')
 
 class NetflixRevenueForecaster:
-    def __init__(self):
+    def __init__(self, registry_dir='outputs/models', n_paths=10000, random_state=42, keep_versions=10):
         self.revenue_data = None
         self.model = None
+        self.model_fit = None
+        self.order = None
+        self.selection_stats = {}
+        self.appends_since_refit = 0
         self.output_dir = 'outputs/results'
         os.makedirs(self.output_dir, exist_ok=True)
+        # Every appended quarter registers a version; keep only the recent ones
+        self.registry = ModelRegistry(registry_dir, keep_versions=keep_versions)
+        self.simulator = ForecastPathSimulator(n_paths=n_paths, random_state=random_state)
     
     def create_revenue_data(self):
-        quarters = pd.date_range(start='2020-01', end='2024-12', freq='Q')
         base_revenue = [6.15, 6.44, 6.77, 7.16, 7.49, 7.87, 8.28, 8.71,
                        9.19, 9.67, 10.19, 10.74, 11.31, 11.93, 12.58, 13.25,
                        13.96, 14.72, 15.51, 16.35]
+        quarters = pd.date_range(start='2020-01', periods=len(base_revenue), freq='Q')
         
         self.revenue_data = pd.DataFrame({
             'quarter': quarters,
@@ -35,31 +46,185 @@ class NetflixRevenueForecaster:
         self.revenue_data.set_index('quarter', inplace=True)
         return self
     
-    def train_arima_model(self):
-        print("Training ARIMA(1,1,1) model...")
-        self.model = ARIMA(self.revenue_data['revenue_billions'], order=(1, 1, 1))
-        self.model_fit = self.model.fit()
+    def train_arima_model(self, order=(1, 1, 1), criterion='aic'):
+        """
+        Fit the revenue ARIMA model
+
+        Parameters:
+        -----------
+        order : tuple or 'auto'
+            ARIMA (p, d, q) order, or 'auto' for a parallel stepwise search
+        criterion : str
+            'aic' or 'bic', used when ``order='auto'``
+        """
+        series = self.revenue_data['revenue_billions']
+        if order == 'auto':
+            print(f"Selecting ARIMA order by {criterion.upper()}...")
+            selector = ARIMAOrderSelector(criterion=criterion, cache=ARIMAFitCache(f'{self.output_dir}/arima_cache'))
+            self.order, self.model_fit = selector.select(series)
+            self.selection_stats = selector.stats
+        else:
+            from statsmodels.tsa.arima.model import ARIMA
+            self.order = tuple(order)
+            print(f"Training ARIMA{self.order} model...")
+            # statsmodels registers 'always' filters on import, overriding the module-level ignore
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                self.model_fit = ARIMA(series, order=self.order).fit()
+        self.model = self.model_fit.model
+        self.appends_since_refit = 0
         print("Model trained successfully")
+        self._register_model(update='refit', selection='auto' if order == 'auto' else 'fixed')
+        return self
+    
+    def _register_model(self, update, **extra):
+        # Persist a compact fitted state (order, parameters, observations) rather than the
+        # full results object; restoring it is a single filter pass with no estimation
+        state = {
+            'order': tuple(self.order),
+            'params': self.model_fit.params,
+            'endog': self.revenue_data['revenue_billions']
+        }
+        self.registry.register(
+            'revenue_arima', state,
+            training_data_hash=data_hash(self.revenue_data['revenue_billions']),
+            params={'order': list(self.order)},
+            metrics={'aic': self.model_fit.aic, 'bic': self.model_fit.bic},
+            n_observations=len(self.revenue_data),
+            artifact='arima_state',
+            update=update,
+            appends_since_refit=self.appends_since_refit,
+            selection_stats={k: v for k, v in self.selection_stats.items() if k != 'best_order'},
+            **extra
+        )
+    
+    def load_registered_model(self, version=None):
+        # Latest version by default; the state is served from the registry's LRU cache when already loaded
+        from statsmodels.tsa.arima.model import ARIMA
+        handle = self.registry.get('revenue_arima', version)
+        state = handle.model
+        self.order = tuple(state['order'])
+        self.revenue_data = state['endog'].to_frame('revenue_billions')
+        self.revenue_data.index.freq = pd.infer_freq(self.revenue_data.index)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.model = ARIMA(self.revenue_data['revenue_billions'], order=self.order)
+            self.model_fit = self.model.filter(state['params'])
+        self.appends_since_refit = handle.metadata.get('appends_since_refit', 0)
         return self
     
-    def generate_forecast(self, periods=12):
-        forecast = self.model_fit.forecast(steps=periods)
+    def update_forecast(self, new_observations, periods=12, refit_every=4, residual_threshold=3.0,
+                        quantiles=DEFAULT_QUANTILES):
+        """
+        Add new quarters to the fitted model and regenerate the forecast without re-estimation
+        
+        The new observations are appended to the existing results with the
+        parameters held fixed (a Kalman filter pass over the data, no
+        optimization). Parameters are re-estimated only every ``refit_every``
+        appends, or when a new observation falls outside the model's
+        ``residual_threshold`` standard errors.
+        
+        Parameters:
+        -----------
+        new_observations : pandas.Series or list
+            New quarterly revenue; plain values are dated as the quarters
+            following the last observation
+        periods : int
+            Number of quarters to forecast
+        refit_every : int
+            Appends allowed before parameters are re-estimated
+        residual_threshold : float
+            Maximum absolute standardized one-step error before a refit
+        quantiles : sequence of float
+            Quantiles of the simulated paths, as in ``generate_forecast``
+        """
+        start = time.perf_counter()
+        if self.model_fit is None:
+            self.load_registered_model()
+        
+        history = self.revenue_data['revenue_billions']
+        if not isinstance(new_observations, pd.Series):
+            new_index = pd.date_range(start=history.index[-1] + pd.DateOffset(months=3),
+                                      periods=len(new_observations), freq=history.index.freq)
+            new_observations = pd.Series(np.asarray(new_observations, dtype=float), index=new_index)
+        new_observations = new_observations.rename('revenue_billions')
+        
+        # Residual check: how surprising are the new quarters under the current model?
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            prediction = self.model_fit.get_forecast(steps=len(new_observations))
+        z_scores = np.abs((new_observations.values - np.asarray(prediction.predicted_mean)) /
+                          np.asarray(prediction.se_mean))
+        
+        self.revenue_data = pd.concat([self.revenue_data, new_observations.to_frame()])
+        self.revenue_data.index.freq = history.index.freq
+        if z_scores.max() > residual_threshold:
+            reason = f'residual check failed (|z|={z_scores.max():.2f} > {residual_threshold})'
+        elif self.appends_since_refit + 1 >= refit_every:
+            reason = f'scheduled refit after {refit_every} appends'
+        else:
+            reason = None
+        
+        if reason is None:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                self.model_fit = self.model_fit.append(new_observations, refit=False)
+            self.model = self.model_fit.model
+            self.appends_since_refit += 1
+            forecast_df = self.generate_forecast(periods=periods, quantiles=quantiles)
+            self._register_model(update='append')
+            path = 'append'
+        else:
+            print(f"Refitting ARIMA{self.order}: {reason}")
+            self.train_arima_model(order=self.order)
+            forecast_df = self.generate_forecast(periods=periods, quantiles=quantiles)
+            path = 'refit'
+        
+        print(f"✓ Forecast updated via {path} with {len(new_observations)} new quarter(s) "
+              f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return forecast_df
+    
+    def generate_forecast(self, periods=12, quantiles=DEFAULT_QUANTILES):
+        """
+        Forecast revenue with simulation-based prediction intervals
+
+        Parameters:
+        -----------
+        periods : int
+            Number of quarters to forecast
+        quantiles : sequence of float
+            Quantiles of the simulated paths written as ``q<percent>``
+            columns; an empty sequence writes point forecasts only
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            forecast = self.model_fit.forecast(steps=periods)
         last_date = self.revenue_data.index[-1]
         forecast_dates = pd.date_range(start=last_date + pd.DateOffset(months=3), periods=periods, freq='Q')
         
         forecast_df = pd.DataFrame({
             'quarter': forecast_dates,
-            'forecasted_revenue_billions': forecast
+            'forecasted_revenue_billions': np.asarray(forecast)
         })
+        if len(quantiles):
+            intervals = self.simulator.simulate(self.model_fit, self.revenue_data['revenue_billions'],
+                                                periods, quantiles=quantiles)
+            forecast_df = pd.concat([forecast_df, intervals.drop(columns='mean')], axis=1)
+            print(f"✓ Simulated {self.simulator.stats['n_paths']} paths for quantiles {list(quantiles)}")
         forecast_df.set_index('quarter', inplace=True)
         forecast_df.to_csv(f'{self.output_dir}/revenue_forecast.csv')
         print(f"Forecast saved: {self.output_dir}/revenue_forecast.csv")
         return forecast_df
     
-    def run_complete_forecast(self):
+    def run_batch_forecast(self, data_path='data/netflix_processed.csv', horizon=12, n_workers=None, engine='arima'):
+        # Title additions per country, genre and rating: ARIMA in a process pool, or the vectorized engine
+        batch = NetflixBatchForecaster(data_path, order=(1, 1, 1), horizon=horizon)
+        return batch.run(n_workers=n_workers, engine=engine)
+    
+    def run_complete_forecast(self, order=(1, 1, 1)):
         print("Netflix Revenue Forecasting Pipeline")
         self.create_revenue_data()
-        self.train_arima_model()
+        self.train_arima_model(order=order)
         forecast_df = self.generate_forecast(periods=12)
         print("Revenue forecasting completed!")
         return self
@@ -0,0 +1,241 @@
+"""
+Netflix Feature Store
+======================
+Author: Vinisha Biju
+Project: Netflix Business Analytics
+Description: Versioned, memory-mapped float32 feature sets shared by the churn and segmentation models
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Feature columns shared by the churn and segmentation models
+CONTENT_FEATURES = ['content_age_years', 'num_genres', 'num_countries', 'is_mature']
+
+
+class FeatureSet:
+    """
+    Read-only view of one materialized feature set version
+
+    The ``raw`` and ``scaled`` attributes are float32 memory maps over the
+    stored arrays, so opening a feature set never copies the data.
+    """
+
+    def __init__(self, path, manifest):
+        self.path = path
+        self.manifest = manifest
+        self.columns = list(manifest['columns'])
+        self.raw = np.load(os.path.join(path, 'raw.npy'), mmap_mode='r')
+        self.scaled = np.load(os.path.join(path, 'scaled.npy'), mmap_mode='r')
+
+    @property
+    def version(self):
+        return self.manifest['version']
+
+    @property
+    def shape(self):
+        return self.raw.shape
+
+    def column_indices(self, columns):
+        """
+        Return the positions of ``columns`` in the stored column order
+        """
+        return [self.columns.index(col) for col in columns]
+
+    def to_frame(self, columns=None, scaled=False):
+        """
+        Return the (optionally scaled) features as a DataFrame
+
+        Parameters:
+        -----------
+        columns : list, optional
+            Subset of columns to return, in the requested order
+        scaled : bool
+            Return standardized values instead of the raw filled values
+        """
+        values = self.scaled if scaled else self.raw
+        columns = columns or self.columns
+        if columns == self.columns:
+            return pd.DataFrame(values, columns=columns, copy=False)
+        return pd.DataFrame(values[:, self.column_indices(columns)], columns=columns)
+
+    def to_scaler(self, columns=None):
+        """
+        Rebuild a fitted StandardScaler from the stored scaler parameters
+        """
+        from sklearn.preprocessing import StandardScaler
+
+        idx = self.column_indices(columns or self.columns)
+        params = self.manifest['scaler']
+        scaler = StandardScaler()
+        scaler.mean_ = np.asarray(params['mean'], dtype=np.float64)[idx]
+        scaler.var_ = np.asarray(params['var'], dtype=np.float64)[idx]
+        scaler.scale_ = np.asarray(params['scale'], dtype=np.float64)[idx]
+        scaler.n_features_in_ = len(idx)
+        scaler.n_samples_seen_ = params['n_samples']
+        return scaler
+
+
+class NetflixFeatureStore:
+    """
+    Local store of named feature sets materialized as contiguous float32 arrays
+
+    Each build is written to its own version directory together with a
+    ``manifest.json`` recording column order, the source data hash and the
+    scaler parameters. A feature set is only rebuilt when the hash of its
+    source columns changes.
+    """
+
+    def __init__(self, root_dir='data/feature_store', keep_versions=3):
+        """
+        Initialize the feature store
+
+        Parameters:
+        -----------
+        root_dir : str
+            Directory holding one sub-directory per feature set
+        keep_versions : int
+            Number of versions retained per feature set; older ones are pruned
+        """
+        self.root_dir = root_dir
+        self.keep_versions = keep_versions
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    @staticmethod
+    def source_hash(df, columns):
+        """
+        Hash the source columns so that any change in the data triggers a rebuild
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps(list(columns)).encode('utf-8'))
+        digest.update(str(len(df)).encode('utf-8'))
+        row_hashes = pd.util.hash_pandas_object(df[list(columns)], index=False)
+        digest.update(row_hashes.values.tobytes())
+        return digest.hexdigest()
+
+    def _set_dir(self, name):
+        return os.path.join(self.root_dir, name)
+
+    def _read_latest(self, name):
+        pointer = os.path.join(self._set_dir(name), 'latest.json')
+        if not os.path.exists(pointer):
+            return None
+        with open(pointer) as f:
+            return json.load(f)
+
+    def materialize(self, name, df, columns, force=False):
+        """
+        Materialize a feature set unless an up-to-date version already exists
+
+        Parameters:
+        -----------
+        name : str
+            Name of the feature set
+        df : pandas.DataFrame
+            Source frame containing the feature columns
+        columns : list
+            Feature columns, stored in this order
+        force : bool
+            Rebuild even if the source hash is unchanged
+
+        Returns:
+        --------
+        FeatureSet
+            Memory-mapped view of the current version
+        """
+        source_hash = self.source_hash(df, columns)
+        latest = self._read_latest(name)
+        if not force and latest is not None and latest['source_hash'] == source_hash:
+            print(f"Feature set '{name}' is up to date (v{latest['version']})")
+            return self.open(name)
+
+        version = 1 if latest is None else latest['version'] + 1
+        version_dir = os.path.join(self._set_dir(name), f'v{version}')
+        os.makedirs(version_dir, exist_ok=True)
+        print(f"Materializing feature set '{name}' v{version}...")
+
+        values = df[list(columns)].fillna(0).to_numpy(dtype=np.float64)
+        mean = values.mean(axis=0)
+        var = values.var(axis=0)
+        scale = np.sqrt(var)
+        scale[scale == 0] = 1.0
+
+        raw = np.lib.format.open_memmap(os.path.join(version_dir, 'raw.npy'), mode='w+',
+                                        dtype=np.float32, shape=values.shape)
+        raw[:] = values
+        raw.flush()
+        scaled = np.lib.format.open_memmap(os.path.join(version_dir, 'scaled.npy'), mode='w+',
+                                           dtype=np.float32, shape=values.shape)
+        scaled[:] = (values - mean) / scale
+        scaled.flush()
+        del raw, scaled
+
+        manifest = {
+            'name': name,
+            'version': version,
+            'columns': list(columns),
+            'dtype': 'float32',
+            'n_rows': int(values.shape[0]),
+            'source_hash': source_hash,
+            'scaler': {
+                'mean': mean.tolist(),
+                'var': var.tolist(),
+                'scale': scale.tolist(),
+                'n_samples': int(values.shape[0])
+            },
+            'created_at': datetime.now().isoformat(timespec='seconds')
+        }
+        with open(os.path.join(version_dir, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        # Swap the latest pointer atomically so readers never see a partial build
+        pointer = os.path.join(self._set_dir(name), 'latest.json')
+        with open(pointer + '.tmp', 'w') as f:
+            json.dump({'version': version, 'source_hash': source_hash}, f)
+        os.replace(pointer + '.tmp', pointer)
+
+        self._prune(name, version)
+        print(f"✓ Feature set '{name}' v{version} saved: {values.shape[0]} rows x {values.shape[1]} columns")
+        return self.open(name)
+
+    def _prune(self, name, current_version):
+        oldest_kept = current_version - self.keep_versions + 1
+        for entry in os.listdir(self._set_dir(name)):
+            if entry.startswith('v') and entry[1:].isdigit() and int(entry[1:]) < oldest_kept:
+                shutil.rmtree(os.path.join(self._set_dir(name), entry), ignore_errors=True)
+
+    def open(self, name, version=None):
+        """
+        Open a feature set version (latest by default) as memory maps
+
+        Parameters:
+        -----------
+        name : str
+            Name of the feature set
+        version : int, optional
+            Specific version to open
+        """
+        if version is None:
+            latest = self._read_latest(name)
+            if latest is None:
+                raise FileNotFoundError(f"Feature set '{name}' has not been materialized")
+            version = latest['version']
+        version_dir = os.path.join(self._set_dir(name), f'v{version}')
+        with open(os.path.join(version_dir, 'manifest.json')) as f:
+            manifest = json.load(f)
+        return FeatureSet(version_dir, manifest)
+
+    def list_versions(self, name):
+        """
+        List the available versions of a feature set
+        """
+        if not os.path.isdir(self._set_dir(name)):
+            return []
+        return sorted(int(entry[1:]) for entry in os.listdir(self._set_dir(name))
+                      if entry.startswith('v') and entry[1:].isdigit())
@@ -0,0 +1,269 @@
+"""
+Netflix Forecast Path Simulation
+=================================
+Author: Vinisha Biju
+Project: Netflix Business Analytics
+Description: Prediction intervals for ARIMA forecasts from bootstrapped residual simulation with streaming quantiles
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+DEFAULT_QUANTILES = (0.05, 0.5, 0.95)
+
+
+def quantile_column(quantile):
+    """
+    Output column name of a quantile, e.g. 0.05 -> 'q5', 0.975 -> 'q97.5'
+    """
+    return f'q{quantile * 100:g}'
+
+
+def arima_spec(model_fit, history):
+    """
+    Extract what path simulation needs from fitted ARIMA results
+
+    Parameters:
+    -----------
+    model_fit : statsmodels ARIMAResults
+        Fitted (or filtered) non-seasonal ARIMA results
+    history : array-like
+        Observed series the model was fitted on
+
+    Returns:
+    --------
+    dict
+        AR and MA coefficients, constant, differencing order, the recent
+        differenced values and innovations that seed every path, the last
+        value of each differencing level, and the centered residual pool
+    """
+    model = model_fit.model
+    if any(model.seasonal_order[:3]):
+        raise ValueError("Path simulation supports non-seasonal ARIMA(p, d, q) models only")
+
+    y = np.asarray(history, dtype=np.float64)
+    d = int(model.k_diff)
+    ar = np.asarray(model_fit.arparams, dtype=np.float64) if model.k_ar_params else np.empty(0)
+    ma = np.asarray(model_fit.maparams, dtype=np.float64) if model.k_ma_params else np.empty(0)
+    const = float(model_fit.params.get('const', 0.0))
+
+    # The first residuals absorb the diffuse initialization; drop them as burn-in
+    resid = np.asarray(model_fit.resid, dtype=np.float64)[d + max(len(ar), len(ma)):]
+    resid = resid[np.isfinite(resid)]
+    if len(resid) < 2:
+        raise ValueError("Too few residuals to bootstrap")
+
+    differenced = np.diff(y, n=d) if d else y
+    return {
+        'ar': ar,
+        'ma': ma,
+        'const': const,
+        'd': d,
+        'recent_w': differenced[len(differenced) - len(ar):] if len(ar) else np.empty(0),
+        'recent_e': resid[len(resid) - len(ma):] if len(ma) else np.empty(0),
+        'last_levels': np.array([np.diff(y, n=k)[-1] for k in range(d)]),
+        'residuals': resid - resid.mean()
+    }
+
+
+def simulate_paths(spec, horizon, n_paths, rng):
+    """
+    Simulate future paths, one vectorized step across all paths per horizon step
+
+    Returns:
+    --------
+    numpy.ndarray
+        Simulated levels of shape (n_paths, horizon)
+    """
+    ar, ma, const, d = spec['ar'], spec['ma'], spec['const'], spec['d']
+    p, q = len(ar), len(ma)
+    # Rolling state per path, most recent value last
+    w_lags = np.tile(spec['recent_w'], (n_paths, 1))
+    e_lags = np.tile(spec['recent_e'], (n_paths, 1))
+    levels = np.tile(spec['last_levels'], (n_paths, 1))
+    shocks = spec['residuals'][rng.integers(0, len(spec['residuals']), size=(n_paths, horizon))]
+
+    paths = np.empty((n_paths, horizon))
+    for h in range(horizon):
+        e = shocks[:, h]
+        # ARMA on the differenced scale; the constant is the process mean
+        w = const + e
+        if p:
+            w += (w_lags[:, ::-1] - const) @ ar
+        if q:
+            w += e_lags[:, ::-1] @ ma
+        if p:
+            w_lags = np.column_stack([w_lags[:, 1:], w])
+        if q:
+            e_lags = np.column_stack([e_lags[:, 1:], e])
+
+        # Integrate back through each differencing level
+        value = w
+        for k in reversed(range(d)):
+            levels[:, k] += value
+            value = levels[:, k]
+        paths[:, h] = value
+    return paths
+
+
+def path_histogram(paths, low, width, n_bins):
+    """
+    Per-horizon histogram counts, underflow, overflow and sums of a block of paths
+    """
+    horizon = paths.shape[1]
+    bins = np.floor((paths - low) / width).astype(np.int64)
+    under = (bins < 0).sum(axis=0)
+    over = (bins >= n_bins).sum(axis=0)
+    inside = (bins >= 0) & (bins < n_bins)
+    flat = (np.arange(horizon)[None, :] * n_bins + bins)[inside]
+    counts = np.bincount(flat, minlength=horizon * n_bins).reshape(horizon, n_bins)
+    return counts, under, over, paths.sum(axis=0), len(paths)
+
+
+class StreamingQuantiles:
+    """
+    Per-horizon histograms that accumulate simulated paths chunk by chunk
+
+    Bin edges are fixed from the first chunk, widened by ``margin`` of its
+    range on each side; later values outside them are counted as underflow
+    or overflow so their share of the tail is still known.
+    """
+
+    def __init__(self, first_paths, n_bins=2000, margin=0.5):
+        low = first_paths.min(axis=0)
+        high = first_paths.max(axis=0)
+        pad = np.maximum((high - low) * margin, 1e-9)
+        self.low = low - pad
+        self.width = (high - low + 2 * pad) / n_bins
+        self.n_bins = n_bins
+        self.horizon = first_paths.shape[1]
+        self.counts = np.zeros((self.horizon, n_bins), dtype=np.int64)
+        self.underflow = np.zeros(self.horizon, dtype=np.int64)
+        self.overflow = np.zeros(self.horizon, dtype=np.int64)
+        self.total = np.zeros(self.horizon)
+        self.n = 0
+        self.add(first_paths)
+
+    def add(self, paths):
+        self.merge(path_histogram(paths, self.low, self.width, self.n_bins))
+
+    def merge(self, histogram):
+        counts, under, over, total, n = histogram
+        self.counts += counts
+        self.underflow += under
+        self.overflow += over
+        self.total += total
+        self.n += n
+
+    def quantiles(self, quantiles):
+        """
+        Interpolated quantiles per horizon step, shape (horizon, len(quantiles))
+
+        Quantiles that fall in the underflow or overflow are clipped to the
+        histogram range.
+        """
+        cumulative = self.underflow[:, None] + np.cumsum(self.counts, axis=1)
+        result = np.empty((self.horizon, len(quantiles)))
+        for j, quantile in enumerate(quantiles):
+            rank = quantile * self.n
+            for h in range(self.horizon):
+                b = min(np.searchsorted(cumulative[h], rank), self.n_bins - 1)
+                before = cumulative[h, b - 1] if b > 0 else self.underflow[h]
+                fraction = np.clip((rank - before) / max(self.counts[h, b], 1), 0, 1)
+                result[h, j] = self.low[h] + (b + fraction) * self.width[h]
+        return result
+
+    def mean(self):
+        return self.total / self.n
+
+
+def _simulate_chunk(spec, horizon, n_paths, seed, low, width, n_bins):
+    # Worker: simulate one seeded chunk and return only its histogram, never the paths
+    paths = simulate_paths(spec, horizon, n_paths, np.random.default_rng(seed))
+    return path_histogram(paths, low, width, n_bins)
+
+
+class ForecastPathSimulator:
+    """
+    Simulation-based prediction intervals for ARIMA forecasts
+
+    Future paths are generated by resampling the model's residuals and
+    running the fitted ARMA recursion on the differenced scale. Paths are
+    simulated in chunks, each with its own child of one ``SeedSequence``, so
+    results depend only on ``random_state`` and ``chunk_size``, not on the
+    number of workers. Chunks are reduced to per-horizon histograms, keeping
+    memory bounded by the chunk size whatever the total path count.
+    """
+
+    def __init__(self, n_paths=10000, chunk_size=100000, n_jobs=-1, n_bins=2000, random_state=42):
+        """
+        Initialize the simulator
+
+        Parameters:
+        -----------
+        n_paths : int
+            Total number of simulated paths
+        chunk_size : int
+            Paths simulated per chunk; chunks after the first run in parallel
+        n_jobs : int
+            Parallel workers for the remaining chunks (-1 uses all cores)
+        n_bins : int
+            Histogram bins per horizon step used for the quantiles
+        random_state : int
+            Seed of the root SeedSequence
+        """
+        self.n_paths = n_paths
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs
+        self.n_bins = n_bins
+        self.random_state = random_state
+        self.stats = {}
+
+    def simulate(self, model_fit, history, horizon, quantiles=DEFAULT_QUANTILES):
+        """
+        Simulate paths and summarize them per horizon step
+
+        Parameters:
+        -----------
+        model_fit : statsmodels ARIMAResults
+            Fitted ARIMA results
+        history : array-like
+            Observed series the model was fitted on
+        horizon : int
+            Steps ahead to simulate
+        quantiles : sequence of float
+            Quantiles to report, each in (0, 1)
+
+        Returns:
+        --------
+        pandas.DataFrame
+            One row per step with the simulated mean and a column per quantile
+        """
+        invalid = [q for q in quantiles if not 0 < q < 1]
+        if invalid:
+            raise ValueError(f"Quantiles must lie in (0, 1), got {invalid}; pass 0.05 rather than 5")
+        spec = arima_spec(model_fit, history)
+        sizes = [min(self.chunk_size, self.n_paths - start) for start in range(0, self.n_paths, self.chunk_size)]
+        seeds = np.random.SeedSequence(self.random_state).spawn(len(sizes))
+
+        # The first chunk runs in-process and fixes the histogram range
+        first = simulate_paths(spec, horizon, sizes[0], np.random.default_rng(seeds[0]))
+        accumulator = StreamingQuantiles(first, n_bins=self.n_bins)
+        del first
+        if len(sizes) > 1:
+            histograms = Parallel(n_jobs=self.n_jobs, return_as='generator')(
+                delayed(_simulate_chunk)(spec, horizon, size, seed, accumulator.low, accumulator.width, self.n_bins)
+                for size, seed in zip(sizes[1:], seeds[1:]))
+            for histogram in histograms:
+                accumulator.merge(histogram)
+
+        self.stats = {
+            'n_paths': accumulator.n,
+            'n_chunks': len(sizes),
+            'n_residuals': len(spec['residuals']),
+            'out_of_range': int(accumulator.underflow.sum() + accumulator.overflow.sum())
+        }
+        summary = pd.DataFrame(accumulator.quantiles(quantiles), columns=[quantile_column(q) for q in quantiles])
+        summary.insert(0, 'mean', accumulator.mean())
+        return summary
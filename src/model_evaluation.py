@@ -0,0 +1,217 @@
+"""
+Netflix Cross-Validated Model Evaluation
+=========================================
+Author: Vinisha Biju
+Project: Netflix Business Analytics
+Description: Parallel repeated stratified k-fold evaluation with bootstrap confidence intervals
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
+from sklearn.model_selection import RepeatedStratifiedKFold
+
+# Metric functions take (y_true, y_pred, y_score) so new metrics can use labels or scores
+DEFAULT_METRICS = {
+    'accuracy': lambda y_true, y_pred, y_score: accuracy_score(y_true, y_pred),
+    'precision': lambda y_true, y_pred, y_score: precision_score(y_true, y_pred, zero_division=0),
+    'recall': lambda y_true, y_pred, y_score: recall_score(y_true, y_pred, zero_division=0),
+    'f1': lambda y_true, y_pred, y_score: f1_score(y_true, y_pred, zero_division=0),
+    'roc_auc': lambda y_true, y_pred, y_score: roc_auc_score(y_true, y_score)
+}
+
+
+def _fit_predict_fold(estimator, X, y, train_idx, test_idx):
+    """
+    Fit one fold and return its out-of-fold predictions
+
+    ``X`` and ``y`` are read-only memory maps shared by all workers.
+    """
+    model = clone(estimator)
+    model.fit(X[train_idx], y[train_idx])
+    y_pred = model.predict(X[test_idx])
+    if hasattr(model, 'predict_proba'):
+        y_score = model.predict_proba(X[test_idx])[:, 1]
+    else:
+        y_score = y_pred.astype(np.float64)
+    return y_pred, y_score
+
+
+class CrossValidatedEvaluator:
+    """
+    Repeated stratified k-fold evaluation with cached fold predictions
+
+    Fold predictions are cached on disk keyed by the data, the estimator
+    parameters and the CV configuration, so evaluating an additional metric
+    never retrains the model.
+    """
+
+    def __init__(self, estimator, n_splits=5, n_repeats=3, random_state=42, n_jobs=-1,
+                 cache_dir='outputs/results/cv_cache'):
+        """
+        Initialize the evaluator
+
+        Parameters:
+        -----------
+        estimator : sklearn estimator
+            Unfitted classifier to evaluate
+        n_splits : int
+            Number of folds per repeat
+        n_repeats : int
+            Number of repeats with different shuffles
+        random_state : int
+            Seed of the fold assignment
+        n_jobs : int
+            Number of parallel fold workers (-1 uses all cores)
+        cache_dir : str
+            Directory of the fold prediction cache
+        """
+        self.estimator = estimator
+        self.n_splits = n_splits
+        self.n_repeats = n_repeats
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.cache_dir = cache_dir
+        self.predictions = None
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _cache_key(self, X, y):
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(X).tobytes())
+        digest.update(np.ascontiguousarray(y).tobytes())
+        params = {k: v for k, v in self.estimator.get_params().items() if k not in ('n_jobs', 'verbose')}
+        digest.update(f"{type(self.estimator).__name__}{sorted(params.items())}".encode('utf-8'))
+        digest.update(f"{self.n_splits}-{self.n_repeats}-{self.random_state}".encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def fit_predict(self, X, y):
+        """
+        Compute (or load from cache) out-of-fold predictions for every repeat
+
+        Parameters:
+        -----------
+        X : array-like
+            Feature matrix
+        y : array-like
+            Binary target
+
+        Returns:
+        --------
+        pandas.DataFrame
+            One row per (repeat, fold, sample) with y_true, y_pred and y_score
+        """
+        X = np.asarray(X, dtype=np.float32)
+        y = np.asarray(y)
+        cache_path = os.path.join(self.cache_dir, f'{self._cache_key(X, y)}.csv')
+        if os.path.exists(cache_path):
+            print(f"✓ Loaded cached fold predictions: {os.path.basename(cache_path)}")
+            self.predictions = pd.read_csv(cache_path)
+            return self.predictions
+
+        cv = RepeatedStratifiedKFold(n_splits=self.n_splits, n_repeats=self.n_repeats,
+                                     random_state=self.random_state)
+        splits = list(cv.split(X, y))
+
+        # Workers train single-threaded; the parallelism is across folds
+        estimator = clone(self.estimator)
+        if 'n_jobs' in estimator.get_params():
+            estimator.set_params(n_jobs=1)
+
+        # Share the data with workers through read-only memory maps instead of pickling copies
+        mmap_dir = tempfile.mkdtemp(prefix='netflix_cv_')
+        try:
+            joblib.dump(X, os.path.join(mmap_dir, 'X.mmap'))
+            joblib.dump(y, os.path.join(mmap_dir, 'y.mmap'))
+            X_shared = joblib.load(os.path.join(mmap_dir, 'X.mmap'), mmap_mode='r')
+            y_shared = joblib.load(os.path.join(mmap_dir, 'y.mmap'), mmap_mode='r')
+
+            print(f"Evaluating {len(splits)} folds ({self.n_repeats}x{self.n_splits}-fold) in parallel...")
+            fold_outputs = Parallel(n_jobs=self.n_jobs)(
+                delayed(_fit_predict_fold)(estimator, X_shared, y_shared, train_idx, test_idx)
+                for train_idx, test_idx in splits
+            )
+        finally:
+            shutil.rmtree(mmap_dir, ignore_errors=True)
+
+        frames = []
+        for split_id, ((_, test_idx), (y_pred, y_score)) in enumerate(zip(splits, fold_outputs)):
+            frames.append(pd.DataFrame({
+                'repeat': split_id // self.n_splits,
+                'fold': split_id % self.n_splits,
+                'index': test_idx,
+                'y_true': y[test_idx],
+                'y_pred': y_pred,
+                'y_score': y_score
+            }))
+        self.predictions = pd.concat(frames, ignore_index=True)
+        self.predictions.to_csv(cache_path, index=False)
+        print(f"✓ Cached fold predictions: {os.path.basename(cache_path)}")
+        return self.predictions
+
+    def fold_scores(self, metrics=None):
+        """
+        Score every fold from the cached predictions
+
+        Parameters:
+        -----------
+        metrics : dict, optional
+            Mapping of metric name to ``f(y_true, y_pred, y_score)``
+        """
+        if self.predictions is None:
+            raise ValueError("Call fit_predict before scoring folds")
+        metrics = metrics or DEFAULT_METRICS
+        rows = []
+        for (repeat, fold), group in self.predictions.groupby(['repeat', 'fold']):
+            row = {'repeat': repeat, 'fold': fold}
+            for name, metric in metrics.items():
+                try:
+                    row[name] = metric(group['y_true'].to_numpy(), group['y_pred'].to_numpy(),
+                                       group['y_score'].to_numpy())
+                except ValueError:
+                    row[name] = np.nan
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    def evaluate(self, metrics=None, n_bootstrap=2000, confidence=0.95, random_state=42):
+        """
+        Summarize each metric as the fold mean with a bootstrap confidence interval
+
+        Parameters:
+        -----------
+        metrics : dict, optional
+            Mapping of metric name to ``f(y_true, y_pred, y_score)``
+        n_bootstrap : int
+            Number of bootstrap resamples of the fold scores
+        confidence : float
+            Confidence level of the interval
+
+        Returns:
+        --------
+        pandas.DataFrame
+            Indexed by metric with mean, std, ci_lower and ci_upper columns
+        """
+        scores = self.fold_scores(metrics).drop(columns=['repeat', 'fold'])
+        rng = np.random.default_rng(random_state)
+        alpha = (1 - confidence) / 2
+        summary = {}
+        for name in scores.columns:
+            values = scores[name].dropna().to_numpy()
+            if len(values) == 0:
+                summary[name] = {'mean': np.nan, 'std': np.nan, 'ci_lower': np.nan, 'ci_upper': np.nan}
+                continue
+            resampled = values[rng.integers(0, len(values), size=(n_bootstrap, len(values)))].mean(axis=1)
+            summary[name] = {
+                'mean': values.mean(),
+                'std': values.std(ddof=1) if len(values) > 1 else 0.0,
+                'ci_lower': np.quantile(resampled, alpha),
+                'ci_upper': np.quantile(resampled, 1 - alpha)
+            }
+        return pd.DataFrame(summary).T
@@ -0,0 +1,254 @@
+"""
+Netflix Model Registry
+=======================
+Author: Vinisha Biju
+Project: Netflix Business Analytics
+Description: Local versioned model registry with compressed artifacts, lazy loading and an in-memory LRU cache
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import joblib
+import numpy as np
+import pandas as pd
+
+
+def data_hash(data):
+    """
+    Hash training data (DataFrame, Series or array) for the model metadata
+    """
+    digest = hashlib.sha256()
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        digest.update(str(list(getattr(data, 'columns', [data.name]))).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+    else:
+        digest.update(np.ascontiguousarray(data).tobytes())
+    return digest.hexdigest()
+
+
+def _to_json(value):
+    # Model params and metrics often hold numpy scalars or objects json cannot encode
+    if isinstance(value, dict):
+        return {str(k): _to_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+class ModelHandle:
+    """
+    Lazy reference to a registered model version
+
+    Metadata is available immediately; the artifact is only deserialized on
+    first access to ``model``.
+    """
+
+    def __init__(self, registry, name, version, metadata):
+        self.registry = registry
+        self.name = name
+        self.version = version
+        self.metadata = metadata
+
+    @property
+    def model(self):
+        return self.registry.load(self.name, self.version)
+
+    def __repr__(self):
+        return f"ModelHandle(name='{self.name}', version={self.version})"
+
+
+class ModelRegistry:
+    """
+    Versioned local store of trained models
+
+    Each version lives in ``<root_dir>/<name>/v<version>/`` with a compressed
+    ``model.joblib`` artifact and a ``metadata.json`` holding the training
+    data hash, parameters, metrics and timestamp. Deserialized models are
+    kept in a bounded LRU cache so repeated lookups in a long-running
+    process skip disk and unpickling. With ``keep_versions`` set, older
+    versions are deleted after each registration.
+    """
+
+    def __init__(self, root_dir='outputs/models', cache_size=8, compress=('zlib', 3), keep_versions=None):
+        """
+        Initialize the registry
+
+        Parameters:
+        -----------
+        root_dir : str
+            Directory holding one sub-directory per model name
+        cache_size : int
+            Maximum number of deserialized models kept in memory
+        compress : tuple or int
+            joblib compression setting for artifacts
+        keep_versions : int, optional
+            Number of most recent versions kept per model (all by default)
+        """
+        self.root_dir = root_dir
+        self.cache_size = cache_size
+        self.compress = compress
+        self.keep_versions = keep_versions
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    def _model_dir(self, name):
+        return os.path.join(self.root_dir, name)
+
+    def _version_dir(self, name, version):
+        return os.path.join(self._model_dir(name), f'v{version}')
+
+    def list_versions(self, name):
+        """
+        List the registered versions of a model, oldest first
+        """
+        if not os.path.isdir(self._model_dir(name)):
+            return []
+        return sorted(int(entry[1:]) for entry in os.listdir(self._model_dir(name))
+                      if entry.startswith('v') and entry[1:].isdigit()
+                      and os.path.exists(os.path.join(self._model_dir(name), entry, 'metadata.json')))
+
+    def latest_version(self, name):
+        versions = self.list_versions(name)
+        return versions[-1] if versions else None
+
+    def register(self, name, model, training_data_hash=None, params=None, metrics=None, **extra):
+        """
+        Store a new version of a model with its metadata
+
+        Parameters:
+        -----------
+        name : str
+            Model name, e.g. 'churn_rf'
+        model : object
+            Fitted model (anything joblib can serialize)
+        training_data_hash : str, optional
+            Hash of the data the model was trained on
+        params : dict, optional
+            Model hyperparameters
+        metrics : dict, optional
+            Evaluation metrics
+        **extra
+            Additional metadata fields
+
+        Returns:
+        --------
+        ModelHandle
+            Handle of the new version
+        """
+        os.makedirs(self._model_dir(name), exist_ok=True)
+
+        # Claim the next version number; makedirs fails if another writer took it
+        version = (self.latest_version(name) or 0) + 1
+        while True:
+            try:
+                os.makedirs(self._version_dir(name, version))
+                break
+            except FileExistsError:
+                version += 1
+
+        version_dir = self._version_dir(name, version)
+        artifact_path = os.path.join(version_dir, 'model.joblib')
+        joblib.dump(model, artifact_path, compress=self.compress)
+
+        metadata = {
+            'name': name,
+            'version': version,
+            'model_class': f"{type(model).__module__}.{type(model).__name__}",
+            'training_data_hash': training_data_hash,
+            'params': _to_json(params or {}),
+            'metrics': _to_json(metrics or {}),
+            'artifact_bytes': os.path.getsize(artifact_path),
+            'created_at': datetime.now().isoformat(timespec='seconds')
+        }
+        metadata.update(_to_json(extra))
+        # Metadata is written last: a version without it is incomplete and ignored
+        with open(os.path.join(version_dir, 'metadata.json'), 'w') as f:
+            json.dump(metadata, f, indent=2)
+
+        with self._lock:
+            self._put((name, version), model)
+        if self.keep_versions:
+            self._prune(name, version)
+        print(f"✓ Registered model: {name} v{version} ({metadata['artifact_bytes'] / 1024:.1f} KB)")
+        return ModelHandle(self, name, version, metadata)
+
+    def _prune(self, name, current_version):
+        oldest_kept = current_version - self.keep_versions + 1
+        for entry in os.listdir(self._model_dir(name)):
+            if entry.startswith('v') and entry[1:].isdigit() and int(entry[1:]) < oldest_kept:
+                shutil.rmtree(os.path.join(self._model_dir(name), entry), ignore_errors=True)
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == name and key[1] < oldest_kept]:
+                del self._cache[key]
+
+    def get(self, name, version=None):
+        """
+        Return a lazy handle to a model version (latest by default)
+
+        Only the metadata is read; the artifact is loaded on first use.
+        """
+        version = version or self.latest_version(name)
+        if version is None:
+            raise FileNotFoundError(f"No registered versions of model '{name}'")
+        with open(os.path.join(self._version_dir(name, version), 'metadata.json')) as f:
+            metadata = json.load(f)
+        return ModelHandle(self, name, version, metadata)
+
+    def load(self, name, version=None):
+        """
+        Deserialize a model version, serving repeated lookups from the LRU cache
+        """
+        version = version or self.latest_version(name)
+        if version is None:
+            raise FileNotFoundError(f"No registered versions of model '{name}'")
+        key = (name, version)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return self._cache[key]
+            self.cache_misses += 1
+
+        model = joblib.load(os.path.join(self._version_dir(name, version), 'model.joblib'))
+        with self._lock:
+            self._put(key, model)
+        return model
+
+    def _put(self, key, model):
+        self._cache[key] = model
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+    def history(self, name):
+        """
+        Metadata of every version of a model as a DataFrame
+        """
+        rows = []
+        for version in self.list_versions(name):
+            metadata = self.get(name, version).metadata
+            rows.append({
+                'version': version,
+                'created_at': metadata['created_at'],
+                'training_data_hash': (metadata['training_data_hash'] or '')[:12],
+                'artifact_bytes': metadata['artifact_bytes'],
+                **{f'metric_{k}': v for k, v in metadata['metrics'].items()}
+            })
+        return pd.DataFrame(rows)
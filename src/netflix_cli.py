@@ -0,0 +1,142 @@
+"""
+Netflix Analytics Command Line Interface
+=========================================
+Author: Vinisha Biju
+Project: Netflix Business Analytics
+Description: Single entry point for the preprocessing, EDA, modeling, scoring and forecasting pipelines
+
+Only the pipeline module of the requested subcommand is imported, and the
+pipelines import matplotlib, seaborn, scikit-learn and statsmodels inside the
+steps that use them, so short scheduled jobs do not pay for unused libraries.
+
+Usage:
+    python src/netflix_cli.py preprocess --input data/netflix_titles.csv --sql data/netflix.db
+    python src/netflix_cli.py eda --sql data/netflix.db
+    python src/netflix_cli.py model --incremental --cross-validate
+    python src/netflix_cli.py score --version 3
+    python src/netflix_cli.py forecast --order auto --quantiles 0.05 0.5 0.95
+"""
+
+import argparse
+import importlib
+import sys
+
+# Pipeline module behind each subcommand, imported when the subcommand runs
+COMMAND_MODULES = {
+    'preprocess': '01_data_preprocessing',
+    'eda': '02_exploratory_data_analysis',
+    'model': '03_predictive_modeling',
+    'score': '03_predictive_modeling',
+    'forecast': '04_revenue_forecasting'
+}
+
+
+def load_command_module(command):
+    """
+    Import the pipeline module of a subcommand
+    """
+    return importlib.import_module(COMMAND_MODULES[command])
+
+
+def quantile(value):
+    """
+    argparse type for a quantile in (0, 1), so percent input fails before any model is fit
+    """
+    q = float(value)
+    if not 0 < q < 1:
+        raise argparse.ArgumentTypeError(f"quantile must lie in (0, 1), got {value}; use 0.05 rather than 5")
+    return q
+
+
+def run_preprocess(args):
+    module = load_command_module('preprocess')
+    (module.NetflixDataPreprocessor(args.input)
+     .load_data()
+     .explore_data()
+     .handle_missing_values()
+     .remove_duplicates()
+     .feature_engineering()
+     .data_validation()
+     .save_processed_data(args.output, sql_path=args.sql)
+     .generate_preprocessing_report())
+
+
+def run_eda(args):
+    module = load_command_module('eda')
+    module.NetflixEDA(args.data, sql_path=args.sql).generate_all_visualizations()
+
+
+def run_model(args):
+    module = load_command_module('model')
+    modeling = module.NetflixPredictiveModels(args.data)
+    modeling.run_all_models(incremental=args.incremental, cross_validate=args.cross_validate)
+
+
+def run_score(args):
+    module = load_command_module('score')
+    module.NetflixPredictiveModels(args.data).score_churn(version=args.version, output_file=args.output)
+
+
+def run_forecast(args):
+    module = load_command_module('forecast')
+    forecaster = module.NetflixRevenueForecaster(n_paths=args.n_paths)
+    if args.update:
+        forecaster.update_forecast(args.update, periods=args.periods, quantiles=args.quantiles)
+    else:
+        order = args.order if args.order == 'auto' else tuple(int(o) for o in args.order.split(','))
+        forecaster.create_revenue_data()
+        forecaster.train_arima_model(order=order)
+        forecaster.generate_forecast(periods=args.periods, quantiles=args.quantiles)
+    if args.batch:
+        forecaster.run_batch_forecast(data_path=args.data, horizon=args.periods, engine=args.engine)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='netflix_cli', description='Netflix Business Analytics pipelines')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    preprocess = subparsers.add_parser('preprocess', help='Clean the raw catalog and engineer features')
+    preprocess.add_argument('--input', default='data/netflix_titles.csv')
+    preprocess.add_argument('--output', default='data/netflix_processed.csv')
+    preprocess.add_argument('--sql', default=None, help='Also load an indexed SQLite store at this path')
+    preprocess.set_defaults(func=run_preprocess)
+
+    eda = subparsers.add_parser('eda', help='Generate EDA visualizations and statistics')
+    eda.add_argument('--data', default='data/netflix_processed.csv')
+    eda.add_argument('--sql', default=None, help='Run aggregations in this SQLite store instead of pandas')
+    eda.set_defaults(func=run_eda)
+
+    model = subparsers.add_parser('model', help='Train churn and segmentation models')
+    model.add_argument('--data', default='data/netflix_processed.csv')
+    model.add_argument('--incremental', action='store_true', help='Warm-start the churn model when drift is small')
+    model.add_argument('--cross-validate', action='store_true', help='Report repeated k-fold confidence intervals')
+    model.set_defaults(func=run_model)
+
+    score = subparsers.add_parser('score', help='Score titles with a registered churn model')
+    score.add_argument('--data', default='data/netflix_processed.csv')
+    score.add_argument('--version', type=int, default=None, help='Model version (latest by default)')
+    score.add_argument('--output', default='churn_scores.csv')
+    score.set_defaults(func=run_score)
+
+    forecast = subparsers.add_parser('forecast', help='Forecast revenue and, optionally, title additions')
+    forecast.add_argument('--order', default='auto', help="'auto' or p,d,q such as 1,1,1")
+    forecast.add_argument('--periods', type=int, default=12)
+    forecast.add_argument('--quantiles', type=quantile, nargs='*', default=[0.05, 0.5, 0.95])
+    forecast.add_argument('--n-paths', type=int, default=10000, help='Simulated paths for the quantiles')
+    forecast.add_argument('--update', type=float, nargs='+', default=None,
+                          help='New quarterly revenue appended to the registered model')
+    forecast.add_argument('--batch', action='store_true', help='Also forecast title additions per series')
+    forecast.add_argument('--engine', choices=['arima', 'vectorized'], default='arima')
+    forecast.add_argument('--data', default='data/netflix_processed.csv')
+    forecast.set_defaults(func=run_forecast)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
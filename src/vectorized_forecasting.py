@@ -0,0 +1,252 @@
+"""
+Netflix Vectorized Forecasting Engine
+======================================
+Author: Vinisha Biju
+Project: Netflix Business Analytics
+Description: Exponential smoothing and seasonal-naive forecasts for many series at once over a (series x time) array
+"""
+
+import itertools
+
+import numpy as np
+
+METHODS = ['ses', 'holt', 'holt_damped', 'seasonal_naive']
+
+# Number of smoothing parameters per method, used for the information criterion in 'auto'
+N_PARAMS = {'ses': 2, 'holt': 4, 'holt_damped': 5, 'seasonal_naive': 0}
+
+
+def _parameter_grid(method, alpha_grid, beta_grid, phi_grid):
+    if method == 'ses':
+        return np.array([(a, 0.0, 1.0) for a in alpha_grid])
+    if method == 'holt':
+        return np.array([(a, b, 1.0) for a, b in itertools.product(alpha_grid, beta_grid)])
+    return np.array(list(itertools.product(alpha_grid, beta_grid, phi_grid)))
+
+
+def _smooth(Y, mask, grid, trend, score_mask=None):
+    """
+    Run exponential smoothing for every series and every parameter combination at once
+
+    Loops over time only; each step updates an (n_series, n_grid) state.
+    Masked (missing) observations propagate the forecast without an update,
+    so ragged series are handled without per-series code.
+
+    Parameters:
+    -----------
+    score_mask : numpy.ndarray, optional
+        (n_series, n_time) time points whose errors are also summed
+        separately, so methods can be compared on the same points
+
+    Returns:
+    --------
+    tuple
+        (sum of squared one-step errors, number of scored errors, final level,
+        final trend, sum of squared errors on ``score_mask``), each of shape
+        (n_series, n_grid) except the error count of shape (n_series,)
+    """
+    n_series, n_time = Y.shape
+    alpha = grid[:, 0][None, :]
+    beta = grid[:, 1][None, :]
+    phi = grid[:, 2][None, :]
+
+    level = np.zeros((n_series, len(grid)))
+    slope = np.zeros((n_series, len(grid)))
+    sse = np.zeros((n_series, len(grid)))
+    sse_scored = np.zeros((n_series, len(grid)))
+    seen = np.zeros(n_series, dtype=np.int64)
+    n_errors = np.zeros(n_series, dtype=np.int64)
+
+    for t in range(n_time):
+        observed = mask[:, t]
+        y = np.where(observed, Y[:, t], 0.0)[:, None]
+        first = (observed & (seen == 0))[:, None]
+        second = (observed & (seen == 1))[:, None] if trend else np.zeros((n_series, 1), dtype=bool)
+        update = (observed & (seen >= (2 if trend else 1)))[:, None]
+
+        damped = phi * slope if trend else 0.0
+        prediction = level + damped
+        error = y - prediction
+        new_level = prediction + alpha * error
+        new_slope = beta * (new_level - level) + (1 - beta) * damped if trend else slope
+
+        sse += np.where(update, error ** 2, 0.0)
+        if score_mask is not None:
+            sse_scored += np.where(update & score_mask[:, t][:, None], error ** 2, 0.0)
+        # Missing steps carry the forecast forward; observed steps apply the update
+        started = (seen > 0)[:, None]
+        level = np.where(update, new_level, np.where(started & ~observed[:, None], prediction, level))
+        if trend:
+            slope = np.where(update, new_slope, np.where(started & ~observed[:, None], damped, slope))
+            # Initialization: level from the first observation, trend from the first difference
+            slope = np.where(second, y - level, slope)
+            level = np.where(second, y, level)
+        level = np.where(first, y, level)
+
+        n_errors += update[:, 0]
+        seen += observed
+    return sse, n_errors, level, slope, sse_scored
+
+
+class VectorizedForecaster:
+    """
+    Batched forecasts for a (series x time) array
+
+    Implements simple exponential smoothing, Holt's linear trend, damped
+    trend and seasonal-naive baselines. Parameter search evaluates the whole
+    grid for every series in the same array operations and picks the best
+    combination per series; there is no per-series Python loop. Series may be
+    ragged: missing values (NaN) before a series starts, or inside it, are
+    masked out.
+    """
+
+    def __init__(self, method='holt_damped', season_length=12,
+                 alpha_grid=np.linspace(0.05, 0.95, 10), beta_grid=np.array([0.01, 0.05, 0.1, 0.2, 0.3]),
+                 phi_grid=np.array([0.8, 0.9, 0.95, 0.98])):
+        """
+        Initialize the forecaster
+
+        Parameters:
+        -----------
+        method : str
+            'ses', 'holt', 'holt_damped', 'seasonal_naive' or 'auto' (best
+            method per series by an AIC-style criterion on one-step errors,
+            scored on the same time points for every method)
+        season_length : int
+            Period of the seasonal-naive baseline
+        alpha_grid, beta_grid, phi_grid : array-like
+            Candidate level, trend and damping parameters
+        """
+        if method not in METHODS + ['auto']:
+            raise ValueError(f"method must be one of {METHODS + ['auto']}")
+        self.method = method
+        self.season_length = season_length
+        self.alpha_grid = np.asarray(alpha_grid, dtype=np.float64)
+        self.beta_grid = np.asarray(beta_grid, dtype=np.float64)
+        self.phi_grid = np.asarray(phi_grid, dtype=np.float64)
+        self.fitted_ = {}
+
+    def _score_mask(self, mask):
+        """
+        Time points where every method has a one-step error
+
+        A point qualifies when it is observed, at least two observations
+        precede it (the trend methods are initialized), the value one season
+        earlier is observed, and it lies at least max(2, season_length)
+        steps after the series start. Scoring all methods on these points
+        keeps their error counts equal, so the criterion does not depend on
+        the units of the data.
+        """
+        m = self.season_length
+        n_time = mask.shape[1]
+        scored = mask & (np.cumsum(mask, axis=1) - mask >= 2)
+        lagged = np.zeros_like(mask)
+        if n_time > m:
+            lagged[:, m:] = mask[:, :-m]
+        start = np.argmax(mask, axis=1)
+        return scored & lagged & (np.arange(n_time)[None, :] >= (start + max(2, m))[:, None])
+
+    def _fit_smoothing(self, Y, mask, method, score_mask=None):
+        grid = _parameter_grid(method, self.alpha_grid, self.beta_grid, self.phi_grid)
+        sse, n_errors, level, slope, sse_scored = _smooth(Y, mask, grid, trend=method != 'ses', score_mask=score_mask)
+        best = np.argmin(sse, axis=1)
+        rows = np.arange(len(Y))
+        return {
+            'params': grid[best],
+            'level': level[rows, best],
+            'slope': slope[rows, best],
+            'sse': sse[rows, best],
+            'n_errors': n_errors,
+            'sse_scored': sse_scored[rows, best]
+        }
+
+    def _fit_seasonal_naive(self, Y, mask, score_mask=None):
+        # One-step errors of the seasonal-naive rule, scored where both points are observed
+        m = self.season_length
+        both = mask[:, m:] & mask[:, :-m] if Y.shape[1] > m else np.zeros((len(Y), 0), dtype=bool)
+        errors = np.where(both, np.nan_to_num(Y[:, m:]) - np.nan_to_num(Y[:, :-m]), 0.0)
+        fitted = {
+            'last_season': Y[:, -m:] if Y.shape[1] >= m else np.full((len(Y), m), np.nan),
+            'last_value': self._last_observed(Y, mask),
+            'sse': (errors ** 2).sum(axis=1),
+            'n_errors': both.sum(axis=1)
+        }
+        if score_mask is not None:
+            fitted['sse_scored'] = np.where(score_mask[:, m:], errors ** 2, 0.0).sum(axis=1)
+        return fitted
+
+    @staticmethod
+    def _last_observed(Y, mask):
+        last = Y.shape[1] - 1 - np.argmax(mask[:, ::-1], axis=1)
+        return np.where(mask.any(axis=1), Y[np.arange(len(Y)), last], np.nan)
+
+    def fit(self, Y):
+        """
+        Fit the chosen method to every series
+
+        Parameters:
+        -----------
+        Y : numpy.ndarray
+            Array of shape (n_series, n_time); NaN marks missing values
+        """
+        Y = np.asarray(Y, dtype=np.float64)
+        mask = ~np.isnan(Y)
+        methods = METHODS if self.method == 'auto' else [self.method]
+        score_mask = self._score_mask(mask) if self.method == 'auto' else None
+        self.fitted_ = {}
+        for method in methods:
+            if method == 'seasonal_naive':
+                self.fitted_[method] = self._fit_seasonal_naive(Y, mask, score_mask)
+            else:
+                self.fitted_[method] = self._fit_smoothing(Y, mask, method, score_mask)
+
+        if self.method == 'auto':
+            n_scored = score_mask.sum(axis=1)
+            scores = np.vstack([self._criterion(self.fitted_[method], method, n_scored) for method in methods])
+            self.best_method_ = np.argmin(scores, axis=0)
+        else:
+            self.best_method_ = np.zeros(len(Y), dtype=np.int64)
+        self.methods_ = methods
+        return self
+
+    @staticmethod
+    def _criterion(fitted, method, n_scored):
+        # Every method is scored on the same n points, so rescaling Y shifts all scores equally
+        n = np.maximum(n_scored, 1)
+        with np.errstate(divide='ignore'):
+            score = n * np.log(np.maximum(fitted['sse_scored'], 1e-300) / n) + 2 * N_PARAMS[method]
+        # Series without common scored points cannot be compared; only keep them eligible for SES
+        return np.where(n_scored > 0, score, np.inf if method != 'ses' else 0.0)
+
+    def _forecast_method(self, method, horizon):
+        fitted = self.fitted_[method]
+        steps = np.arange(1, horizon + 1)
+        if method == 'seasonal_naive':
+            m = self.season_length
+            forecast = fitted['last_season'][:, (steps - 1) % m]
+            # Series shorter than a season fall back to their last value
+            return np.where(np.isnan(forecast), fitted['last_value'][:, None], forecast)
+        if method == 'ses':
+            return np.repeat(fitted['level'][:, None], horizon, axis=1)
+        phi = fitted['params'][:, 2][:, None]
+        damping = np.cumsum(phi ** steps[None, :], axis=1)
+        return fitted['level'][:, None] + damping * fitted['slope'][:, None]
+
+    def forecast(self, horizon):
+        """
+        Forecast every series ``horizon`` steps ahead
+
+        Returns:
+        --------
+        numpy.ndarray
+            Array of shape (n_series, horizon)
+        """
+        forecasts = np.stack([self._forecast_method(method, horizon) for method in self.methods_])
+        return forecasts[self.best_method_, np.arange(forecasts.shape[1])]
+
+    @property
+    def selected_methods(self):
+        """
+        Name of the method used for each series
+        """
+        return np.asarray(self.methods_)[self.best_method_]